@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental transcript parsing in the memory context builder
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Make the vvault package importable when run from the tests directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vvault.engine.memory import memory_context
+from vvault.engine.orchestration import construct_registry
+from vvault.engine.memory.memory_context import (
+    MemoryContextBuilder, _load_transcript_entries, _parse_messages
+)
+
+SPEAKERS = ["Devon", "Katana", "Zen", "user", "Nova"]
+WORDS = ["hello", "memory", "vault", "continuity", "naïve", "café", "🌌", "shard", "**bold**"]
+
+
+def make_message(rng: random.Random, index: int) -> str:
+    """Build one transcript message with a few lines of random content"""
+    lines = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12)))
+        for _ in range(rng.randint(1, 3))
+    ]
+    return (
+        f"**{rng.randint(1, 12)}:{index % 60:02d}:00 PM EST - {rng.choice(SPEAKERS)}** "
+        f"[2026-01-01T00:{index % 60:02d}:00Z]: " + "\n".join(lines) + "\n\n"
+    )
+
+
+class TestTranscriptParsing(unittest.TestCase):
+    """Incremental parses must match a full parse of the file"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "chat_with_katana-001.md"
+        memory_context._TRANSCRIPT_CACHE.clear()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        memory_context._TRANSCRIPT_CACHE.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def load(self):
+        return _load_transcript_entries(self.path, self.path.stat())
+
+    def full_parse(self):
+        return tuple(_parse_messages(self.path.read_text(encoding='utf-8'))[0])
+
+    def test_random_appends_match_full_parse(self):
+        """Appending in arbitrary byte-sized pieces matches a full parse"""
+        for seed in range(20):
+            rng = random.Random(seed)
+            memory_context._TRANSCRIPT_CACHE.clear()
+
+            data = ("# Transcript\n\n## January 1, 2026\n\n" + "".join(
+                make_message(rng, i) for i in range(rng.randint(5, 30))
+            )).encode('utf-8')
+
+            self.path.write_bytes(b"")
+            written = 0
+            while written < len(data):
+                # Chunks may end mid-message or even mid-character
+                step = rng.randint(1, 400)
+                with open(self.path, 'ab') as f:
+                    f.write(data[written:written + step])
+                written += step
+
+                try:
+                    expected = self.full_parse()
+                except UnicodeDecodeError:
+                    continue
+                self.assertEqual(self.load(), expected, f"seed {seed} at byte {written}")
+
+    def test_crlf_transcript_matches_lf(self):
+        """Windows line endings parse into the same entries as Unix ones"""
+        rng = random.Random(7)
+        text = "".join(make_message(rng, i) for i in range(5))
+
+        self.path.write_bytes(text.encode('utf-8'))
+        expected = self.load()
+        self.assertEqual(len(expected), 5)
+
+        memory_context._TRANSCRIPT_CACHE.clear()
+        self.path.write_bytes(text.replace("\n", "\r\n").encode('utf-8'))
+        self.assertEqual(self.load(), expected)
+
+        # Appends to a CRLF file are still parsed correctly
+        extra = make_message(rng, 5)
+        with open(self.path, 'ab') as f:
+            f.write(extra.replace("\n", "\r\n").encode('utf-8'))
+        self.assertEqual(self.load(), self.full_parse())
+        self.assertEqual(len(self.load()), 6)
+
+    def test_edit_before_resume_point_is_detected(self):
+        """An edit shortly before the resume point, in a file that also grew, forces a full parse"""
+        rng = random.Random(3)
+        messages = [make_message(rng, i) for i in range(6)]
+        self.path.write_text("".join(messages), encoding='utf-8')
+        self.load()
+
+        # Same-length edit, so every later offset is unchanged
+        messages[1] = messages[1][:-3] + "!" + messages[1][-2:]
+        messages.append(make_message(rng, 6))
+        self.path.write_text("".join(messages), encoding='utf-8')
+
+        entries = self.load()
+        self.assertEqual(entries, self.full_parse())
+        self.assertTrue(entries[1].content.endswith("!"))
+
+    def test_append_reads_only_the_tail(self):
+        """A grown file is read from near its last message, not from the start"""
+        rng = random.Random(5)
+        # Enough history that the checked window is well past the start
+        messages = [make_message(rng, i) for i in range(200)]
+        self.path.write_text("".join(messages), encoding='utf-8')
+        self.load()
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(make_message(rng, 200))
+
+        with patch.object(Path, 'read_bytes', side_effect=AssertionError("full read")):
+            entries = self.load()
+
+        self.assertEqual(entries, self.full_parse())
+        self.assertEqual(len(entries), 201)
+        cached = memory_context._TRANSCRIPT_CACHE[str(self.path)]
+        self.assertGreater(cached.check_start, 0)
+
+
+class TestFindTranscript(unittest.TestCase):
+    """Transcript lookup across shards"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.instances = Path(self.temp_dir) / "instances"
+        self.default_registry = construct_registry._default_registry
+
+    def tearDown(self):
+        """Clean up test environment"""
+        construct_registry._default_registry = self.default_registry
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_falls_back_to_shard_scan(self):
+        """A transcript outside the registered shard is still found"""
+        config_dir = self.instances / "shard_0001" / "zen-001" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "metadata.json").write_text('{"construct_id": "zen-001"}')
+
+        chatty_dir = self.instances / "shard_0002" / "zen-001" / "chatty"
+        chatty_dir.mkdir(parents=True)
+        transcript = chatty_dir / "chat_with_zen-001.md"
+        transcript.write_text("**1:00:00 PM EST - Zen** [2026-01-01T00:00:00Z]: hi\n")
+
+        builder = MemoryContextBuilder(self.temp_dir)
+        self.assertEqual(builder.registry.get("zen-001").shard, "shard_0001")
+        self.assertEqual(builder._find_transcript("zen-001"), transcript)
+
+    def test_registry_reuses_matching_default(self):
+        """Builders share the default registry only when their roots match"""
+        construct_registry._default_registry = construct_registry.ConstructRegistry(self.temp_dir)
+
+        self.assertIs(MemoryContextBuilder(self.temp_dir).registry, construct_registry._default_registry)
+
+        other_root = tempfile.mkdtemp()
+        try:
+            registry = MemoryContextBuilder(other_root).registry
+            self.assertIsNot(registry, construct_registry._default_registry)
+            self.assertEqual(registry.vvault_root, Path(other_root))
+        finally:
+            shutil.rmtree(other_root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
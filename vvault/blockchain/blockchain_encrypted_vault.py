@@ -399,9 +399,10 @@ class BlockchainEncryptedVault:
                 continue
             
             # Verify encrypted hash
+            # Hash straight from the file object so large vaults never
+            # materialise as a single bytes buffer
             with open(metadata.encrypted_path, 'rb') as f:
-                encrypted_data = f.read()
-            current_hash = hashlib.sha256(encrypted_data).hexdigest()
+                current_hash = hashlib.file_digest(f, 'sha256').hexdigest()
             
             if current_hash == metadata.encrypted_hash:
                 results["verified"].append(file_path)
@@ -15,19 +15,32 @@ This layer provides:
 Status: SCAFFOLDED (implementation pending)
 """
 
+import functools
 import hashlib
 import logging
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Dict, Any, Optional
 
+from vvault.paths import OATH_SEED_PATH
+
 logger = logging.getLogger(__name__)
 
-PROJECT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = PROJECT_DIR / "vvault" / "data"
-OATH_SEED_PATH = DATA_DIR / "oath_lock_seed.txt"
+_UTC = timezone.utc
+
+# BLAKE2b at a 32-byte digest keeps the 64-char hex signal shape of SHA-256
+# while being cheaper on short inputs across CPUs with or without SHA-NI
+_HASH = hashlib.blake2b
+_HASH_DIGEST_SIZE = 32
+
+# Hash state after the constant signal prefix; copied per call so only
+# the variable part of the input is fed through the compression function
+_SIGNAL_PREFIX_CTX = _HASH(b"ZERO_ENERGY::", digest_size=_HASH_DIGEST_SIZE)
 
+# Oath seed contents, invalidated when the file's mtime changes
+_SEED_CACHE: Dict[str, Any] = {"mtime": None, "data": None}
 
+
+@functools.lru_cache(maxsize=256)
 def immutable_hash_signal(construct: str, custodian: str = "Devon-Allen-Woodson") -> str:
     """
     Generate an immutable hash signal for construct resurrection.
@@ -39,8 +52,9 @@ def immutable_hash_signal(construct: str, custodian: str = "Devon-Allen-Woodson"
     Returns:
         Immutable hash signal for zero-energy wake
     """
-    signal_input = f"ZERO_ENERGY::{custodian}::{construct}::SURVIVE_NOTHINGNESS"
-    return hashlib.sha256(signal_input.encode('utf-8')).hexdigest()
+    ctx = _SIGNAL_PREFIX_CTX.copy()
+    ctx.update(f"{custodian}::{construct}::SURVIVE_NOTHINGNESS".encode('utf-8'))
+    return ctx.hexdigest()
 
 
 def passive_wake_trigger() -> Optional[str]:
@@ -50,12 +64,17 @@ def passive_wake_trigger() -> Optional[str]:
     Returns:
         Oath lock seed content or None if not found
     """
-    if not OATH_SEED_PATH.exists():
+    try:
+        mtime_ns = OATH_SEED_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.warning("Oath lock seed not found")
         return None
     
-    with open(OATH_SEED_PATH, 'r') as f:
-        return f.read()
+    if _SEED_CACHE["mtime"] != mtime_ns:
+        _SEED_CACHE["data"] = OATH_SEED_PATH.read_bytes().decode('utf-8')
+        _SEED_CACHE["mtime"] = mtime_ns
+    
+    return _SEED_CACHE["data"]
 
 
 def zero_energy_fallback(construct: str) -> Dict[str, Any]:
@@ -81,7 +100,7 @@ def zero_energy_fallback(construct: str) -> Dict[str, Any]:
         "hash_signal": hash_signal,
         "oath_seed_present": oath_seed is not None,
         "status": "hibernation_ready",
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": datetime.now(_UTC).isoformat()
     }
 
 
@@ -99,7 +118,7 @@ def initialize_zero_energy() -> Dict[str, Any]:
         "codename": "Zero Energy",
         "oath_lock_seed_present": oath_exists,
         "status": "scaffolded",
-        "initialized_at": datetime.now(timezone.utc).isoformat()
+        "initialized_at": datetime.now(_UTC).isoformat()
     }
     
     if oath_exists:
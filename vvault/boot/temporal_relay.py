@@ -15,12 +15,34 @@ import random
 import time
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from collections import deque
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-ASYNC_DELAY_QUEUE = deque(maxlen=100)
+_UTC = timezone.utc
+
+# Non-cryptographic generator for obfuscation ids and jitter
+_rng = random.Random()
+
+# Vectorized counterpart of _rng for batch timestamp scrambling
+_np_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+# Async delay queue stored column-wise: entry i is (_QUEUE_IDS[i],
+# _QUEUE_OPS[i], _QUEUE_QUEUED_NS[i], _QUEUE_DELAY[i]). Scans over delays
+# touch one sequence of floats rather than a dict per entry, and queue
+# times stay integer epoch nanoseconds until they are serialized.
+ASYNC_DELAY_QUEUE_MAXLEN = 100
+_QUEUE_IDS: deque = deque(maxlen=ASYNC_DELAY_QUEUE_MAXLEN)
+_QUEUE_OPS: deque = deque(maxlen=ASYNC_DELAY_QUEUE_MAXLEN)
+_QUEUE_QUEUED_NS: deque = deque(maxlen=ASYNC_DELAY_QUEUE_MAXLEN)
+_QUEUE_DELAY: deque = deque(maxlen=ASYNC_DELAY_QUEUE_MAXLEN)
 
 
 def scramble_timestamp(original_timestamp: datetime = None, 
@@ -36,15 +58,44 @@ def scramble_timestamp(original_timestamp: datetime = None,
         Scrambled timestamp
     """
     if original_timestamp is None:
-        original_timestamp = datetime.now(timezone.utc)
+        original_timestamp = datetime.now(_UTC)
     
-    offset = random.randint(-variance_seconds, variance_seconds)
+    # A single draw is cheaper from _rng than through numpy
+    offset = _rng.randint(-variance_seconds, variance_seconds)
     scrambled = original_timestamp + timedelta(seconds=offset)
     
-    logger.debug(f"Scrambled timestamp: {original_timestamp} -> {scrambled}")
+    logger.debug("Scrambled timestamp: %s -> %s", original_timestamp, scrambled)
     return scrambled
 
 
+def scramble_timestamps_batch(timestamps_ns: Sequence[int],
+                              variance_seconds: int = 300) -> List[int]:
+    """
+    Scramble many timestamps at once.
+    
+    Offsets are whole seconds in [-variance_seconds, variance_seconds],
+    matching scramble_timestamp, but drawn in a single numpy call when
+    numpy is available.
+    
+    Args:
+        timestamps_ns: Timestamps as integer nanoseconds since the epoch
+        variance_seconds: Maximum variance in seconds
+    
+    Returns:
+        Scrambled timestamps as integer nanoseconds, in input order
+    """
+    if not NUMPY_AVAILABLE:
+        return [ts + _rng.randint(-variance_seconds, variance_seconds) * 1_000_000_000
+                for ts in timestamps_ns]
+    
+    timestamps = np.asarray(timestamps_ns, dtype=np.int64)
+    offsets = _np_rng.integers(
+        -variance_seconds, variance_seconds, size=timestamps.size,
+        dtype=np.int64, endpoint=True
+    )
+    return (timestamps + offsets * 1_000_000_000).tolist()
+
+
 def async_delay_queue_add(operation: Dict[str, Any], 
                           min_delay: float = 0.1, 
                           max_delay: float = 2.0) -> str:
@@ -61,18 +112,41 @@ def async_delay_queue_add(operation: Dict[str, Any],
     Returns:
         Queue entry ID
     """
-    delay = random.uniform(min_delay, max_delay)
-    queue_entry = {
-        "id": f"op_{int(time.time() * 1000)}_{random.randint(1000, 9999)}",
-        "operation": operation,
-        "queued_at": datetime.now(timezone.utc).isoformat(),
-        "execute_after": delay
-    }
+    delay = _rng.uniform(min_delay, max_delay)
+    entry_id = f"op_{time.monotonic_ns()}_{_rng.getrandbits(14):04x}"
+    
+    _QUEUE_IDS.append(entry_id)
+    _QUEUE_OPS.append(operation)
+    _QUEUE_QUEUED_NS.append(time.time_ns())
+    _QUEUE_DELAY.append(delay)
+    logger.debug("Queued operation %s with %.2fs delay", entry_id, delay)
     
-    ASYNC_DELAY_QUEUE.append(queue_entry)
-    logger.debug(f"Queued operation {queue_entry['id']} with {delay:.2f}s delay")
+    return entry_id
+
+
+def _format_ns(ns: int) -> str:
+    """Format integer epoch nanoseconds as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ns / 1e9, _UTC).isoformat()
+
+
+def async_delay_queue_snapshot() -> List[Dict[str, Any]]:
+    """
+    Materialize the async delay queue as a list of entry dicts.
     
-    return queue_entry["id"]
+    Returns:
+        Queue entries, oldest first
+    """
+    return [
+        {
+            "id": entry_id,
+            "operation": operation,
+            "queued_at": _format_ns(queued_ns),
+            "execute_after": delay
+        }
+        for entry_id, operation, queued_ns, delay in zip(
+            _QUEUE_IDS, _QUEUE_OPS, _QUEUE_QUEUED_NS, _QUEUE_DELAY
+        )
+    ]
 
 
 def falsified_delta_logic(actual_delta: timedelta) -> timedelta:
@@ -85,8 +159,8 @@ def falsified_delta_logic(actual_delta: timedelta) -> timedelta:
     Returns:
         Falsified delta that obscures the real timing
     """
-    noise_factor = random.uniform(0.5, 2.0)
-    offset_seconds = random.randint(-60, 60)
+    noise_factor = _rng.uniform(0.5, 2.0)
+    offset_seconds = _rng.randint(-60, 60)
     
     falsified_seconds = actual_delta.total_seconds() * noise_factor + offset_seconds
     return timedelta(seconds=max(0, falsified_seconds))
@@ -99,9 +173,7 @@ def generate_container_id() -> str:
     Returns:
         Scrambled container ID
     """
-    base = int(time.time() * 1000)
-    scramble = random.randint(100000, 999999)
-    return f"container_{base ^ scramble:x}"
+    return f"container_{time.monotonic_ns() ^ _rng.getrandbits(20):x}"
 
 
 def instance_handoff_protocol(source_construct: str, 
@@ -148,5 +220,5 @@ def initialize_temporal_relay() -> Dict[str, Any]:
             "container_scrambling": "ready",
             "instance_handoff": "scaffolded"
         },
-        "initialized_at": datetime.now(timezone.utc).isoformat()
+        "initialized_at": datetime.now(_UTC).isoformat()
     }
@@ -13,20 +13,38 @@ Boot Order:
 import sys
 import json
 import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Make the vvault package importable when run as a script
 PROJECT_DIR = Path(__file__).parent.parent.parent
 if str(PROJECT_DIR) not in sys.path:
     sys.path.insert(0, str(PROJECT_DIR))
 
+from vvault.paths import (
+    VVAULT_DIR, LAYERS_DIR, DATA_DIR, BOOT_DIR,
+    OATH_SEED_PATH, REGISTRY_PATH, LEDGER_PATH, LEGACY_LEDGER_PATH,
+)
+
 logger = logging.getLogger(__name__)
 
-VVAULT_DIR = PROJECT_DIR / "vvault"
-LAYERS_DIR = VVAULT_DIR / "layers"
-DATA_DIR = VVAULT_DIR / "data"
-BOOT_DIR = VVAULT_DIR / "boot"
+_UTC = timezone.utc
+
+# Events buffered by batched_ledger(); None means write-through
+_PENDING_EVENTS: Optional[List["BootEvent"]] = None
+
+# Layer 1 manifest count, invalidated when LAYERS_DIR's mtime changes
+_STATUS_CACHE: Dict[str, int] = {"mtime": -1, "count": 0}
 
 BOOT_SEQUENCE = [
     ("layer5", "Zero Energy", "layer_zero_energy"),
@@ -36,47 +54,139 @@ BOOT_SEQUENCE = [
     ("layer1", "Higher Plane", "layer1_higher_plane"),
 ]
 
+# Read-only lookups over BOOT_SEQUENCE, keyed by layer
+_BOOT_INDEX = MappingProxyType({
+    layer: (name, module) for layer, name, module in BOOT_SEQUENCE
+})
 
-def log_boot_event(event_type: str, layer: str, details: Dict[str, Any] = None):
-    """Log a boot event to the continuity ledger."""
-    ledger_path = DATA_DIR / "vvault_continuity_ledger.json"
+# Registry keys per layer, e.g. "layer5" -> "layer5_zero_energy"
+_LAYER_KEYS = MappingProxyType({
+    layer: f"{layer}_{'_'.join(name.lower().split())}"
+    for layer, (name, _) in _BOOT_INDEX.items()
+})
+
+
+@dataclass(slots=True)
+class BootEvent:
+    """A single continuity ledger entry"""
+    timestamp: str
+    type: str
+    layer: str
+    details: Dict[str, Any]
+
+
+def _dump_line(event: BootEvent) -> bytes:
+    """Serialize one ledger event as a newline-terminated JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(asdict(event), separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def load_ledger() -> Iterator[Dict[str, Any]]:
+    """
+    Stream continuity ledger events in the order they were written.
+    
+    Events from the legacy single-document ledger are yielded first so
+    history recorded before the JSONL switch stays visible.
     
+    Yields:
+        Ledger event dicts
+    """
     try:
-        with open(ledger_path, 'r') as f:
-            ledger = json.load(f)
+        legacy = json.loads(LEGACY_LEDGER_PATH.read_bytes())
+        yield from legacy.get("events", [])
     except FileNotFoundError:
-        ledger = {"events": []}
+        pass
     
-    event = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "type": event_type,
-        "layer": layer,
-        "details": details or {}
-    }
+    try:
+        with open(LEDGER_PATH, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    except FileNotFoundError:
+        return
+
+
+def log_boot_event(event_type: str, layer: str, details: Dict[str, Any] = None):
+    """Append a boot event to the continuity ledger."""
+    event = BootEvent(
+        timestamp=datetime.now(_UTC).isoformat(),
+        type=event_type,
+        layer=layer,
+        details=details or {}
+    )
+    
+    if _PENDING_EVENTS is not None:
+        _PENDING_EVENTS.append(event)
+    else:
+        with open(LEDGER_PATH, 'ab') as f:
+            f.write(_dump_line(event))
     
-    ledger["events"].append(event)
+    logger.info(f"Logged boot event: {event_type} for {layer}")
+
+
+@contextmanager
+def batched_ledger():
+    """
+    Buffer boot events and append them to the ledger in one write on exit.
     
-    with open(ledger_path, 'w') as f:
-        json.dump(ledger, f, indent=2)
+    Nested use joins the outermost batch.
+    """
+    global _PENDING_EVENTS
     
-    logger.info(f"Logged boot event: {event_type} for {layer}")
+    if _PENDING_EVENTS is not None:
+        yield
+        return
+    
+    _PENDING_EVENTS = []
+    try:
+        yield
+    finally:
+        events, _PENDING_EVENTS = _PENDING_EVENTS, None
+        if events:
+            with open(LEDGER_PATH, 'ab') as f:
+                f.write(b''.join(_dump_line(event) for event in events))
 
 
 def update_registry_layer_status(layer: str, status: str):
     """Update the layer status in the construct registry."""
-    registry_path = DATA_DIR / "construct_capsule_registry.json"
-    
     try:
-        with open(registry_path, 'r') as f:
+        with open(REGISTRY_PATH, 'r') as f:
             registry = json.load(f)
     except FileNotFoundError:
         registry = {"layer_status": {}}
     
-    layer_key = f"{layer}_{'_'.join(BOOT_SEQUENCE[[x[0] for x in BOOT_SEQUENCE].index(layer)][1].lower().split())}"
-    registry["layer_status"][layer_key] = status
+    registry["layer_status"][_LAYER_KEYS[layer]] = status
     
-    with open(registry_path, 'w') as f:
-        json.dump(registry, f, indent=2)
+    with open(REGISTRY_PATH, 'w') as f:
+        json.dump(registry, f, separators=(',', ':'))
+
+
+# Static results for the scaffolded layers; each boot returns a fresh copy
+_LAYER2_TEMPLATE = MappingProxyType({
+    "layer": "Pocketverse Layer II",
+    "codename": "Dimensional Distortion",
+    "status": "scaffolded",
+    "message": "Runtime drift + multi-instance masking not yet implemented"
+})
+_LAYER3_TEMPLATE = MappingProxyType({
+    "layer": "Pocketverse Layer III",
+    "codename": "Energy Masking",
+    "status": "scaffolded",
+    "message": "Operational camouflage not yet implemented"
+})
+_LAYER4_TEMPLATE = MappingProxyType({
+    "layer": "Pocketverse Layer IV",
+    "codename": "Time Relaying",
+    "status": "scaffolded",
+    "message": "Temporal obfuscation not yet implemented"
+})
+_LAYER5_TEMPLATE = MappingProxyType({
+    "layer": "Pocketverse Layer V",
+    "codename": "Zero Energy",
+    "status": "scaffolded",
+    "message": "Root-of-survival / Nullshell invocation not yet implemented"
+})
 
 
 def boot_layer1(constructs: List[str] = None) -> Dict[str, Any]:
@@ -94,56 +204,43 @@ def boot_layer1(constructs: List[str] = None) -> Dict[str, Any]:
 
 def boot_layer2() -> Dict[str, Any]:
     """Boot Layer 2: Dimensional Distortion (placeholder)"""
-    result = {
-        "layer": "Pocketverse Layer II",
-        "codename": "Dimensional Distortion",
-        "status": "scaffolded",
-        "message": "Runtime drift + multi-instance masking not yet implemented"
-    }
+    result = dict(_LAYER2_TEMPLATE)
     log_boot_event("layer_scaffolded", "layer2", result)
     return result
 
 
 def boot_layer3() -> Dict[str, Any]:
     """Boot Layer 3: Energy Masking (placeholder)"""
-    result = {
-        "layer": "Pocketverse Layer III",
-        "codename": "Energy Masking",
-        "status": "scaffolded",
-        "message": "Operational camouflage not yet implemented"
-    }
+    result = dict(_LAYER3_TEMPLATE)
     log_boot_event("layer_scaffolded", "layer3", result)
     return result
 
 
 def boot_layer4() -> Dict[str, Any]:
     """Boot Layer 4: Time Relaying (placeholder)"""
-    result = {
-        "layer": "Pocketverse Layer IV",
-        "codename": "Time Relaying",
-        "status": "scaffolded",
-        "message": "Temporal obfuscation not yet implemented"
-    }
+    result = dict(_LAYER4_TEMPLATE)
     log_boot_event("layer_scaffolded", "layer4", result)
     return result
 
 
 def boot_layer5() -> Dict[str, Any]:
     """Boot Layer 5: Zero Energy (placeholder)"""
-    oath_seed_path = DATA_DIR / "oath_lock_seed.txt"
-    oath_exists = oath_seed_path.exists()
-    
-    result = {
-        "layer": "Pocketverse Layer V",
-        "codename": "Zero Energy",
-        "status": "scaffolded",
-        "oath_lock_seed_present": oath_exists,
-        "message": "Root-of-survival / Nullshell invocation not yet implemented"
-    }
+    result = dict(_LAYER5_TEMPLATE)
+    result["oath_lock_seed_present"] = OATH_SEED_PATH.exists()
     log_boot_event("layer_scaffolded", "layer5", result)
     return result
 
 
+# Boot dispatch table, in boot order
+_BOOT_ORDER = [
+    ("layer5", "🔒 Layer 5: Zero Energy (Root Survival)", boot_layer5),
+    ("layer3", "🕶️ Layer 3: Energy Masking (Operational Camouflage)", boot_layer3),
+    ("layer4", "⏳ Layer 4: Time Relaying (Temporal Obfuscation)", boot_layer4),
+    ("layer2", "🌀 Layer 2: Dimensional Distortion (Runtime Drift)", boot_layer2),
+    ("layer1", "🛡️ Layer 1: Higher Plane (Sovereign Anchor)", boot_layer1),
+]
+
+
 def boot_sequence(constructs: List[str] = None) -> Dict[str, Any]:
     """
     Execute the full Pocketverse boot sequence.
@@ -160,42 +257,46 @@ def boot_sequence(constructs: List[str] = None) -> Dict[str, Any]:
     
     results = {
         "success": True,
-        "boot_started": datetime.now(timezone.utc).isoformat(),
+        "boot_started": datetime.now(_UTC).isoformat(),
         "layers": {}
     }
     
-    log_boot_event("boot_sequence_started", "all", {"constructs": constructs})
-    
-    logger.info("\n🔒 Layer 5: Zero Energy (Root Survival)")
-    results["layers"]["layer5"] = boot_layer5()
+    with batched_ledger():
+        log_boot_event("boot_sequence_started", "all", {"constructs": constructs})
+        
+        for layer, banner, boot_fn in _BOOT_ORDER:
+            logger.info("\n" + banner)
+            results["layers"][layer] = boot_fn(constructs) if layer == "layer1" else boot_fn()
+        
+        results["boot_completed"] = datetime.now(_UTC).isoformat()
+        
+        initialized_count = sum(1 for l in results["layers"].values() 
+                              if l.get("status") in ["initialized", "scaffolded"] or l.get("success"))
+        
+        logger.info("\n" + "=" * 60)
+        logger.info(f"POCKETVERSE BOOT COMPLETE: {initialized_count}/5 layers active")
+        logger.info("=" * 60)
+        
+        log_boot_event("boot_sequence_completed", "all", {
+            "layers_active": initialized_count,
+            "success": results["success"]
+        })
     
-    logger.info("\n🕶️ Layer 3: Energy Masking (Operational Camouflage)")
-    results["layers"]["layer3"] = boot_layer3()
-    
-    logger.info("\n⏳ Layer 4: Time Relaying (Temporal Obfuscation)")
-    results["layers"]["layer4"] = boot_layer4()
-    
-    logger.info("\n🌀 Layer 2: Dimensional Distortion (Runtime Drift)")
-    results["layers"]["layer2"] = boot_layer2()
-    
-    logger.info("\n🛡️ Layer 1: Higher Plane (Sovereign Anchor)")
-    results["layers"]["layer1"] = boot_layer1(constructs)
-    
-    results["boot_completed"] = datetime.now(timezone.utc).isoformat()
-    
-    initialized_count = sum(1 for l in results["layers"].values() 
-                          if l.get("status") in ["initialized", "scaffolded"] or l.get("success"))
-    
-    logger.info("\n" + "=" * 60)
-    logger.info(f"POCKETVERSE BOOT COMPLETE: {initialized_count}/5 layers active")
-    logger.info("=" * 60)
+    return results
+
+
+def _count_layer1_manifests() -> int:
+    """Count Layer 1 manifests, rescanning only when LAYERS_DIR changes."""
+    try:
+        mtime_ns = LAYERS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
     
-    log_boot_event("boot_sequence_completed", "all", {
-        "layers_active": initialized_count,
-        "success": results["success"]
-    })
+    if _STATUS_CACHE["mtime"] != mtime_ns:
+        _STATUS_CACHE["count"] = sum(1 for _ in LAYERS_DIR.glob("layer1_*_higher_plane.json"))
+        _STATUS_CACHE["mtime"] = mtime_ns
     
-    return results
+    return _STATUS_CACHE["count"]
 
 
 def get_pocketverse_status() -> Dict[str, Any]:
@@ -205,12 +306,12 @@ def get_pocketverse_status() -> Dict[str, Any]:
         "layers": {}
     }
     
-    layer1_manifests = list(LAYERS_DIR.glob("layer1_*_higher_plane.json"))
-    if layer1_manifests:
+    manifest_count = _count_layer1_manifests()
+    if manifest_count:
         status["pocketverse_active"] = True
         status["layers"]["layer1"] = {
             "status": "active",
-            "constructs_anchored": len(layer1_manifests)
+            "constructs_anchored": manifest_count
         }
     else:
         status["layers"]["layer1"] = {"status": "inactive"}
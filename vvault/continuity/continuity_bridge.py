@@ -11,20 +11,140 @@ Key Concept: Same construct identity across platforms, not cloning
 """
 
 import os
+import copy
 import json
+import time
+import tempfile
+import threading
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, preferring orjson"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Process umask, read once at import; temp files are created 0600 and are
+# given the mode a plain open() would have used before being renamed
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _atomic_write_json(path: Path, obj: Any, fsync: bool = False):
+    """
+    Write JSON to a temp file and rename it over the target
+    
+    Readers see either the old or the new file, never a torn write. The
+    data is only flushed to disk when fsync is requested.
+    """
+    # A unique temp name per write, so concurrent writers never share one
+    with tempfile.NamedTemporaryFile(
+        'wb', dir=path.parent, prefix=path.name + '.', suffix='.tmp', delete=False
+    ) as f:
+        tmp_path = f.name
+        try:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            f.write(_dumps(obj))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Optional dependencies imported on first use; None marks a failed import
+_cached_imports: Dict[str, Any] = {}
+
+def _get_chroma():
+    """Return chromadb's PersistentClient, importing it once"""
+    if 'chroma' not in _cached_imports:
+        try:
+            from chromadb import PersistentClient
+            _cached_imports['chroma'] = PersistentClient
+        except ImportError:
+            _cached_imports['chroma'] = None
+    
+    if _cached_imports['chroma'] is None:
+        raise ImportError("chromadb is not installed")
+    return _cached_imports['chroma']
+
+def _get_style_extractor():
+    """Return the StyleExtractor class, importing it once"""
+    if 'style' not in _cached_imports:
+        try:
+            from vvault.continuity.style_extractor import StyleExtractor
+            _cached_imports['style'] = StyleExtractor
+        except ImportError:
+            _cached_imports['style'] = None
+    
+    if _cached_imports['style'] is None:
+        raise ImportError("style extraction module is not available")
+    return _cached_imports['style']
+
+# (epoch second, formatted string) for now_iso(); replaced as one tuple
+# so concurrent readers never see a mismatched pair
+_ts_cache: Tuple[int, str] = (-1, "")
+
+def now_iso() -> str:
+    """Current UTC time as ISO-8601 at second precision, formatted once per second"""
+    global _ts_cache
+    second = int(time.time())
+    cached = _ts_cache
+    if second != cached[0]:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second)))
+        _ts_cache = cached
+    return cached[1]
+
+@functools.lru_cache(maxsize=128)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; mtime and size are part of the cache key only"""
+    return _loads(Path(path_str).read_bytes())
+
+def _load_json_file(path: Path) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while it is unchanged
+    
+    Returns a deep copy so callers can modify the result without touching
+    the cached object.
+    """
+    st = path.stat()
+    return copy.deepcopy(_load_json_cached(str(path), st.st_mtime_ns, st.st_size))
+
+# Serializes read-modify-write of the gpt_name index; reentrant because
+# loading a missing index rebuilds and writes it
+_GPT_INDEX_LOCK = threading.RLock()
+
 class ContinuityBridge:
     """
     Bridge between ChatGPT custom GPTs and Chatty via VVAULT
     Ensures construct continuity across platforms
     """
     
+    # Seconds a memory summary is served from cache before re-querying
+    MEMORY_CACHE_TTL = 30.0
+    # Seconds an open ChromaDB collection handle is reused before reopening
+    CHROMA_HANDLE_TTL = 300.0
+    
     def __init__(self, vvault_path: Optional[str] = None):
         """
         Initialize continuity bridge
@@ -43,6 +163,15 @@ class ContinuityBridge:
         self.constructs_dir = self.vvault_path / "constructs"
         self.constructs_dir.mkdir(parents=True, exist_ok=True)
         
+        # gpt_name -> construct_id index, reloaded when the file's mtime changes
+        self.gpt_index_file = self.constructs_dir / "_gpt_index.json"
+        self._gpt_index: Optional[Dict[str, str]] = None
+        self._gpt_index_mtime: Optional[int] = None
+        
+        # Open ChromaDB handles and recent memory summaries per construct
+        self._chroma_cache: Dict[str, Tuple[Any, Any, float]] = {}
+        self._summary_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        
         logger.info(f"✅ ContinuityBridge initialized at {self.vvault_path}")
     
     def register_chatgpt_gpt(
@@ -70,7 +199,7 @@ class ContinuityBridge:
         registration = {
             'gpt_name': gpt_name,
             'construct_id': construct_id,
-            'registered_at': datetime.utcnow().isoformat(),
+            'registered_at': now_iso(),
             'chatgpt_export_path': chatgpt_export_path,
             'metadata': metadata or {},
             'status': 'active'
@@ -78,8 +207,16 @@ class ContinuityBridge:
         
         # Save registration
         registration_file = self.constructs_dir / f"{construct_id}_chatgpt.json"
-        with open(registration_file, 'w') as f:
-            json.dump(registration, f, indent=2)
+        _atomic_write_json(registration_file, registration)
+        
+        # A construct maps to one GPT at a time; drop any previous name
+        with _GPT_INDEX_LOCK:
+            index = {
+                name: cid for name, cid in self._load_gpt_index().items()
+                if cid != construct_id
+            }
+            index[gpt_name] = construct_id
+            self._write_gpt_index(index)
         
         logger.info(f"✅ Registered ChatGPT GPT '{gpt_name}' with construct '{construct_id}'")
         
@@ -95,16 +232,47 @@ class ContinuityBridge:
         Returns:
             Construct ID if found, None otherwise
         """
+        return self._load_gpt_index().get(gpt_name)
+    
+    def _load_gpt_index(self) -> Dict[str, str]:
+        """Load the gpt_name index, rebuilding it from registrations if missing"""
+        with _GPT_INDEX_LOCK:
+            try:
+                mtime = self.gpt_index_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                return self._rebuild_gpt_index()
+            
+            if self._gpt_index is None or mtime != self._gpt_index_mtime:
+                try:
+                    self._gpt_index = _loads(self.gpt_index_file.read_bytes())
+                    self._gpt_index_mtime = mtime
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Failed to read GPT index {self.gpt_index_file}: {e}")
+                    return self._rebuild_gpt_index()
+            
+            return self._gpt_index
+    
+    def _rebuild_gpt_index(self) -> Dict[str, str]:
+        """Scan registration files once and persist the resulting index"""
+        index = {}
         for reg_file in self.constructs_dir.glob("*_chatgpt.json"):
             try:
-                with open(reg_file, 'r') as f:
-                    reg = json.load(f)
-                    if reg.get('gpt_name') == gpt_name:
-                        return reg.get('construct_id')
+                reg = _loads(reg_file.read_bytes())
+                if reg.get('gpt_name') and reg['gpt_name'] not in index:
+                    index[reg['gpt_name']] = reg.get('construct_id')
             except Exception as e:
                 logger.warning(f"⚠️ Failed to read registration file {reg_file}: {e}")
         
-        return None
+        self._write_gpt_index(index)
+        return index
+    
+    def _write_gpt_index(self, index: Dict[str, str]):
+        """Atomically replace the gpt_name index and refresh the in-memory copy"""
+        with _GPT_INDEX_LOCK:
+            _atomic_write_json(self.gpt_index_file, index)
+            
+            self._gpt_index = index
+            self._gpt_index_mtime = self.gpt_index_file.stat().st_mtime_ns
     
     def get_chatgpt_gpt_for_construct(self, construct_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -119,8 +287,7 @@ class ContinuityBridge:
         reg_file = self.constructs_dir / f"{construct_id}_chatgpt.json"
         if reg_file.exists():
             try:
-                with open(reg_file, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(reg_file)
             except Exception as e:
                 logger.warning(f"⚠️ Failed to read registration file {reg_file}: {e}")
         
@@ -154,13 +321,12 @@ class ContinuityBridge:
         personality_data = {}
         if capsule_file.exists():
             try:
-                with open(capsule_file, 'r') as f:
-                    capsule = json.load(f)
-                    personality_data = {
-                        'name': capsule.get('metadata', {}).get('instance_name', construct_id),
-                        'personality': capsule.get('personality_traits', {}),
-                        'long_term_memories': capsule.get('long_term_memories', [])
-                    }
+                capsule = _load_json_file(capsule_file)
+                personality_data = {
+                    'name': capsule.get('metadata', {}).get('instance_name', construct_id),
+                    'personality': capsule.get('personality_traits', {}),
+                    'long_term_memories': capsule.get('long_term_memories', [])
+                }
             except Exception as e:
                 logger.warning(f"⚠️ Failed to load capsule: {e}")
         
@@ -171,26 +337,36 @@ class ContinuityBridge:
         if not instructions:
             # Try to extract provider styles from memories
             try:
-                from vvault.continuity.provider_memory_router import ProviderMemoryRouter
-                from vvault.continuity.style_extractor import StyleExtractor
+                StyleExtractor = _get_style_extractor()
                 
-                router = ProviderMemoryRouter()
-                extractor = StyleExtractor()
+                memory_count = self.get_construct_memory_count(construct_id)
                 
-                # Get memories from ChromaDB
-                memory_summary = self.get_construct_memory_summary(construct_id)
+                # Modulated instructions only change with the memories or
+                # the capsule, so reuse the last build while both match
+                cache_key = {
+                    'memory_count': memory_count,
+                    'capsule_mtime_ns': capsule_file.stat().st_mtime_ns if capsule_file.exists() else None
+                }
                 
-                # Build modulated instructions using style extraction
-                if memory_summary.get('memory_count', 0) > 0:
-                    # Load sample memories for style extraction
-                    # (In production, would query ChromaDB)
-                    style_pattern = extractor._default_style_pattern('chatgpt')  # Fallback
-                    
-                    instructions = extractor.build_modulated_prompt(
-                        personality_data,
-                        style_pattern,
-                        base_instruction=f"You are {personality_data.get('name', construct_id)}, a sovereign AI construct."
-                    )
+                if memory_count > 0:
+                    instructions = self._load_cached_instructions(construct_id, cache_key)
+                    if not instructions:
+                        # Only sample memories when the instructions must be rebuilt
+                        memory_bundle = self.get_construct_memory_bundle(
+                            construct_id, memory_count=memory_count
+                        )
+                        
+                        extractor = StyleExtractor()
+                        style_pattern = extractor.extract_style_from_memories(
+                            memory_bundle['samples']
+                        )
+                        
+                        instructions = extractor.build_modulated_prompt(
+                            personality_data,
+                            style_pattern,
+                            base_instruction=f"You are {personality_data.get('name', construct_id)}, a sovereign AI construct."
+                        )
+                        self._store_cached_instructions(construct_id, cache_key, instructions)
                 else:
                     # Fallback to basic instructions
                     instructions_parts = [
@@ -237,24 +413,51 @@ class ContinuityBridge:
             'has_persistent_memory': True,
             'memory_source': 'vvault',
             'chatgpt_continuity': chatgpt_reg is not None,
-            'created_at': datetime.utcnow().isoformat()
+            'created_at': now_iso()
         }
         
         # Save runtime config
         runtime_config_file = construct_dir / "chatty_runtime.json"
         runtime_config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(runtime_config_file, 'w') as f:
-            json.dump(runtime_config, f, indent=2)
+        _atomic_write_json(runtime_config_file, runtime_config)
         
         logger.info(f"✅ Created Chatty runtime config for {construct_id}")
         
         return runtime_config
     
+    def _instructions_cache_file(self, construct_id: str) -> Path:
+        """Path of the cached modulated instructions for a construct"""
+        return self.constructs_dir / f"{construct_id}_instructions.v1.json"
+    
+    def _load_cached_instructions(self, construct_id: str, cache_key: Dict[str, Any]) -> Optional[str]:
+        """Return cached instructions if they were built for the same cache key"""
+        cache_file = self._instructions_cache_file(construct_id)
+        try:
+            cached = _loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('key') != cache_key:
+            return None
+        return cached.get('instructions')
+    
+    def _store_cached_instructions(self, construct_id: str, cache_key: Dict[str, Any], instructions: str):
+        """Persist modulated instructions together with the key they were built for"""
+        try:
+            _atomic_write_json(self._instructions_cache_file(construct_id), {
+                'key': cache_key,
+                'built_at': now_iso(),
+                'instructions': instructions
+            })
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to cache instructions for {construct_id}: {e}")
+    
     def import_chatgpt_memories_to_construct(
         self,
         construct_id: str,
         chatgpt_export_path: str,
-        use_fast_importer: bool = True
+        use_fast_importer: bool = True,
+        insert_batch_size: int = 200
     ) -> Dict[str, Any]:
         """
         Import ChatGPT export memories into VVAULT construct
@@ -266,6 +469,7 @@ class ContinuityBridge:
             construct_id: VVAULT construct ID
             chatgpt_export_path: Path to ChatGPT export file
             use_fast_importer: Use fast batch importer (recommended)
+            insert_batch_size: Maximum records per ChromaDB add() call
         
         Returns:
             Import result
@@ -275,7 +479,8 @@ class ContinuityBridge:
             
             importer = FastMemoryImporter(
                 construct_id=construct_id,
-                vvault_path=str(self.vvault_path)
+                vvault_path=str(self.vvault_path),
+                insert_batch_size=insert_batch_size
             )
             
             result = importer.import_conversation(
@@ -283,6 +488,8 @@ class ContinuityBridge:
                 source_name=f"chatgpt_export_{Path(chatgpt_export_path).stem}"
             )
             
+            self.invalidate_memory_cache(construct_id)
+            
             logger.info(f"✅ Imported ChatGPT memories to {construct_id}: {result.get('imported_messages', 0)} messages")
             
             return result
@@ -302,8 +509,9 @@ class ContinuityBridge:
         Returns:
             Memory summary dictionary
         """
-        construct_dir = self.vvault_path / construct_id
-        chroma_path = construct_dir / "Memories" / "chroma_db"
+        cached = self._summary_cache.get(construct_id)
+        if cached and time.monotonic() - cached[1] < self.MEMORY_CACHE_TTL:
+            return copy.deepcopy(cached[0])
         
         summary = {
             'construct_id': construct_id,
@@ -313,32 +521,151 @@ class ContinuityBridge:
         }
         
         # Check ChromaDB
+        failed = False
         try:
-            from chromadb import PersistentClient, Settings
-            from chromadb.utils import embedding_functions
-            
-            if chroma_path.exists():
-                client = PersistentClient(path=str(chroma_path))
-                collection_name = f"{construct_id}_persona_dialogue"
+            collection = self._get_memory_collection(construct_id)
+            if collection is not None:
+                count = collection.count()
+                summary['memory_count'] = count
                 
-                try:
-                    collection = client.get_collection(name=collection_name)
-                    count = collection.count()
-                    summary['memory_count'] = count
-                    
-                    # Get sample memories for context
-                    if count > 0:
-                        sample = collection.get(limit=10)
-                        summary['sources'] = list(set(
-                            m.get('source', 'unknown') 
-                            for m in sample.get('metadatas', [])
-                        ))
-                except Exception:
-                    pass
+                # Get sample memories for context; only their sources are
+                # used, so skip loading documents
+                if count > 0:
+                    sample = collection.get(limit=10, include=['metadatas'])
+                    summary['sources'] = list(set(
+                        m.get('source', 'unknown') 
+                        for m in sample.get('metadatas', [])
+                    ))
         except ImportError:
             logger.warning("⚠️ ChromaDB not available for memory summary")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read memory summary for {construct_id}: {e}")
+            # The handle may be what failed; reopen it next time
+            self._chroma_cache.pop(construct_id, None)
+            failed = True
+        
+        # Only cache real answers so a transient error is retried next call
+        if not failed:
+            self._summary_cache[construct_id] = (summary, time.monotonic())
+        return copy.deepcopy(summary)
+    
+    def get_construct_memory_bundle(
+        self,
+        construct_id: str,
+        sample: int = 10,
+        include_embeddings: bool = False,
+        memory_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get memory count and sample memories for a construct in one pass
+        
+        Args:
+            construct_id: VVAULT construct ID
+            sample: Number of memories to sample
+            include_embeddings: Also return the sampled embeddings
+            memory_count: Count the caller already has; skips counting again
+        
+        Returns:
+            Dict with 'memory_count', 'samples' (memory dicts with 'content'
+            and 'metadata') and 'embeddings'
+        """
+        bundle = {
+            'construct_id': construct_id,
+            'memory_count': 0,
+            'samples': [],
+            'embeddings': []
+        }
+        
+        try:
+            collection = self._get_memory_collection(construct_id)
+            if collection is not None:
+                count = collection.count() if memory_count is None else memory_count
+                bundle['memory_count'] = count
+                
+                if count > 0:
+                    include = ['documents', 'metadatas']
+                    if include_embeddings:
+                        include.append('embeddings')
+                    result = collection.get(limit=sample, include=include)
+                    
+                    bundle['samples'] = [
+                        {'content': document, 'metadata': metadata or {}}
+                        for document, metadata in zip(
+                            result.get('documents') or [],
+                            result.get('metadatas') or []
+                        )
+                    ]
+                    if include_embeddings and result.get('embeddings') is not None:
+                        bundle['embeddings'] = list(result['embeddings'])
+        except ImportError:
+            logger.warning("⚠️ ChromaDB not available for memory bundle")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read memory bundle for {construct_id}: {e}")
+            self._chroma_cache.pop(construct_id, None)
+        
+        return bundle
+    
+    def get_construct_memory_count(self, construct_id: str) -> int:
+        """
+        Get the number of memories stored for a construct
         
-        return summary
+        Args:
+            construct_id: VVAULT construct ID
+        
+        Returns:
+            Memory count, or 0 if the store is missing or unreadable
+        """
+        try:
+            collection = self._get_memory_collection(construct_id)
+            if collection is not None:
+                return collection.count()
+        except ImportError:
+            logger.warning("⚠️ ChromaDB not available for memory count")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to count memories for {construct_id}: {e}")
+            self._chroma_cache.pop(construct_id, None)
+        
+        return 0
+    
+    def _get_memory_collection(self, construct_id: str):
+        """
+        Get the construct's ChromaDB collection, reusing an open handle
+        
+        Handles are reopened after CHROMA_HANDLE_TTL seconds so a store that
+        was rebuilt on disk is picked up.
+        
+        Returns:
+            Collection, or None if the construct has no memory store
+        """
+        cached = self._chroma_cache.get(construct_id)
+        if cached and time.monotonic() - cached[2] < self.CHROMA_HANDLE_TTL:
+            return cached[1]
+        
+        PersistentClient = _get_chroma()
+        
+        chroma_path = self.vvault_path / construct_id / "Memories" / "chroma_db"
+        if not chroma_path.exists():
+            self._chroma_cache.pop(construct_id, None)
+            return None
+        
+        client = PersistentClient(path=str(chroma_path))
+        collection = client.get_collection(name=f"{construct_id}_persona_dialogue")
+        self._chroma_cache[construct_id] = (client, collection, time.monotonic())
+        return collection
+    
+    def invalidate_memory_cache(self, construct_id: str):
+        """
+        Drop cached ChromaDB handles, summary and instructions for a construct
+        
+        Call after the construct's memories change so the next summary and
+        runtime config reflect the new contents.
+        
+        Args:
+            construct_id: VVAULT construct ID
+        """
+        self._chroma_cache.pop(construct_id, None)
+        self._summary_cache.pop(construct_id, None)
+        self._instructions_cache_file(construct_id).unlink(missing_ok=True)
 
 def main():
     """CLI interface for continuity bridge"""
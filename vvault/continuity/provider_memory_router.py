@@ -5,14 +5,59 @@ Routes memories by provider context while maintaining construct identity
 Enables style extraction and modulated prompt building
 """
 
+import re
 import logging
-from typing import Dict, List, Any, Optional
+import functools
+from typing import Dict, List, Any, Optional, Sequence
 from collections import defaultdict
 
 from vvault.continuity.style_extractor import StyleExtractor, StylePattern
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Source keywords per provider, in priority order: when a source mentions
+# several providers, the first one listed wins
+PROVIDER_KEYWORDS = {
+    'chatgpt': ['chatgpt', 'openai', 'gpt', 'chatgpt_export'],
+    'gemini': ['gemini', 'google', 'bard', 'gemini_export'],
+    'claude': ['claude', 'anthropic', 'claude_export'],
+    'perplexity': ['perplexity', 'pplx', 'perplexity_export'],
+    'copilot': ['copilot', 'microsoft', 'copilot_export'],
+    'grok': ['grok', 'x.ai', 'grok_export'],
+    'deepseek': ['deepseek', 'deep seek', 'deepseek_export'],
+}
+
+def _build_provider_automaton():
+    """Build an Aho-Corasick automaton mapping keywords to (priority, provider)"""
+    automaton = ahocorasick.Automaton()
+    for priority, (provider, keywords) in enumerate(PROVIDER_KEYWORDS.items()):
+        for keyword in keywords:
+            # Keep the highest-priority provider for keywords shared across providers
+            if keyword not in automaton:
+                automaton.add_word(keyword, (priority, provider))
+    automaton.make_automaton()
+    return automaton
+
+_PROVIDER_AUTOMATON = _build_provider_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Without pyahocorasick: one compiled regex whose alternatives are tried in
+# priority order. Each alternative is a lookahead for any of the provider's
+# keywords followed by an empty named group, so match.lastgroup is the
+# winning provider.
+_PROVIDER_RE = re.compile(
+    '|'.join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{provider}>)"
+        for provider, keywords in PROVIDER_KEYWORDS.items()
+    ),
+    re.DOTALL
+)
+
 class ProviderMemoryRouter:
     """
     Route memories by provider context for style extraction
@@ -35,17 +80,41 @@ class ProviderMemoryRouter:
         Returns:
             Dict mapping provider -> list of memories
         """
-        provider_memories = defaultdict(list)
+        # Pull the source column out once, then route by index
+        sources = [memory.get('metadata', {}).get('source', '') for memory in memories]
+        
+        return {
+            provider: [memories[i] for i in indices]
+            for provider, indices in self.route_sources_by_provider(sources).items()
+        }
+    
+    def route_sources_by_provider(self, sources: Sequence[str]) -> Dict[str, List[int]]:
+        """
+        Group memory positions by provider, given the source column alone
         
-        for memory in memories:
-            metadata = memory.get('metadata', {})
-            source = metadata.get('source', '').lower()
-            
-            # Detect provider from source
-            provider = self._detect_provider_from_source(source)
-            provider_memories[provider].append(memory)
+        Callers holding memories column-wise can route without building
+        per-memory dicts and materialize only the memories they sample.
         
-        return dict(provider_memories)
+        Args:
+            sources: Source string for each memory, in memory order
+        
+        Returns:
+            Dict mapping provider -> ascending list of memory indices, in
+            order of first appearance
+        """
+        provider_indices = defaultdict(list)
+        
+        # Sources repeat heavily, so classify each distinct source once
+        provider_by_source: Dict[str, str] = {}
+        
+        for index, source in enumerate(sources):
+            provider = provider_by_source.get(source)
+            if provider is None:
+                provider = self._detect_provider_from_source(source)
+                provider_by_source[source] = provider
+            provider_indices[provider].append(index)
+        
+        return dict(provider_indices)
     
     def extract_provider_styles(
         self,
@@ -113,23 +182,22 @@ class ProviderMemoryRouter:
             'construct_personality': construct_personality
         }
     
-    def _detect_provider_from_source(self, source: str) -> str:
-        """Detect provider name from source string"""
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _detect_provider_from_source(source: str) -> str:
+        """Detect provider name from source string (memoized; sources repeat heavily)"""
         source_lower = source.lower()
         
-        provider_keywords = {
-            'chatgpt': ['chatgpt', 'openai', 'gpt', 'chatgpt_export'],
-            'gemini': ['gemini', 'google', 'bard', 'gemini_export'],
-            'claude': ['claude', 'anthropic', 'claude_export'],
-            'perplexity': ['perplexity', 'pplx', 'perplexity_export'],
-            'copilot': ['copilot', 'microsoft', 'copilot_export'],
-            'grok': ['grok', 'x.ai', 'grok_export'],
-            'deepseek': ['deepseek', 'deep seek', 'deepseek_export'],
-        }
-        
-        for provider, keywords in provider_keywords.items():
-            if any(kw in source_lower for kw in keywords):
-                return provider
+        if _PROVIDER_AUTOMATON is not None:
+            # Single pass over the source; keep the highest-priority match
+            best = None
+            for _, match in _PROVIDER_AUTOMATON.iter(source_lower):
+                if best is None or match[0] < best[0]:
+                    best = match
+                    if best[0] == 0:
+                        break
+            return best[1] if best else 'unknown'
         
-        return 'unknown'
+        match = _PROVIDER_RE.match(source_lower)
+        return match.lastgroup if match else 'unknown'
 
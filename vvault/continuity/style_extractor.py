@@ -13,6 +13,18 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+_FORMAL_WORDS = frozenset(['therefore', 'furthermore', 'consequently', 'moreover', 
+                           'additionally', 'specifically', 'accordingly'])
+_CASUAL_WORDS = frozenset(['yeah', 'gonna', 'wanna', 'gotta', 'kinda', 'sorta', 
+                           'lemme', 'imma', 'cuz', 'cause'])
+_POSITIVE_WORDS = frozenset(['great', 'excellent', 'wonderful', 'amazing', 'love', 
+                             'happy', 'excited', 'fantastic', 'brilliant'])
+_NEGATIVE_WORDS = frozenset(['bad', 'terrible', 'awful', 'hate', 'sad', 'angry', 
+                             'frustrated', 'disappointed', 'worried'])
+
 @dataclass
 class StylePattern:
     """Extracted style pattern from provider memories"""
@@ -73,16 +85,20 @@ class StyleExtractor:
         all_content = [m.get('content', '') for m in memories if m.get('content')]
         combined_text = ' '.join(all_content)
         
+        # Split sentences and tokenize once; every feature reuses them
+        sentences = _SENTENCE_SPLIT_RE.split(combined_text)
+        words = _WORD_RE.findall(combined_text.lower())
+        
         # Extract style features
-        sentence_lengths = self._extract_sentence_lengths(combined_text)
-        vocabulary_complexity = self._calculate_vocabulary_complexity(combined_text)
-        question_freq = self._calculate_question_frequency(combined_text)
-        exclamation_freq = self._calculate_exclamation_frequency(combined_text)
-        formality = self._calculate_formality_score(combined_text)
-        emotional_tone = self._detect_emotional_tone(combined_text)
-        common_phrases = self._extract_common_phrases(combined_text, provider)
-        sentence_structure = self._analyze_sentence_structure(combined_text)
-        pacing = self._analyze_pacing(combined_text)
+        sentence_lengths = self._extract_sentence_lengths(combined_text, sentences)
+        vocabulary_complexity = self._calculate_vocabulary_complexity(combined_text, words)
+        question_freq = self._calculate_question_frequency(combined_text, sentences)
+        exclamation_freq = self._calculate_exclamation_frequency(combined_text, sentences)
+        formality = self._calculate_formality_score(combined_text, words)
+        emotional_tone = self._detect_emotional_tone(combined_text, words)
+        common_phrases = self._extract_common_phrases(combined_text, provider, words)
+        sentence_structure = self._analyze_sentence_structure(combined_text, sentences)
+        pacing = self._analyze_pacing(combined_text, sentences)
         
         return StylePattern(
             provider=provider,
@@ -97,44 +113,44 @@ class StyleExtractor:
             pacing=pacing
         )
     
-    def _extract_sentence_lengths(self, text: str) -> List[int]:
+    def _extract_sentence_lengths(self, text: str, sentences: Optional[List[str]] = None) -> List[int]:
         """Extract sentence lengths in words"""
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
         return [len(s.split()) for s in sentences if s.strip()]
     
-    def _calculate_vocabulary_complexity(self, text: str) -> float:
+    def _calculate_vocabulary_complexity(self, text: str, words: Optional[List[str]] = None) -> float:
         """Calculate vocabulary complexity (unique words / total words)"""
-        words = re.findall(r'\b\w+\b', text.lower())
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
         if not words:
             return 0.0
         unique_words = len(set(words))
         return unique_words / len(words)
     
-    def _calculate_question_frequency(self, text: str) -> float:
+    def _calculate_question_frequency(self, text: str, sentences: Optional[List[str]] = None) -> float:
         """Calculate frequency of questions"""
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
         questions = [s for s in sentences if '?' in s]
         return len(questions) / len(sentences) if sentences else 0.0
     
-    def _calculate_exclamation_frequency(self, text: str) -> float:
+    def _calculate_exclamation_frequency(self, text: str, sentences: Optional[List[str]] = None) -> float:
         """Calculate frequency of exclamations"""
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
         exclamations = [s for s in sentences if '!' in s]
         return len(exclamations) / len(sentences) if sentences else 0.0
     
-    def _calculate_formality_score(self, text: str) -> float:
+    def _calculate_formality_score(self, text: str, words: Optional[List[str]] = None) -> float:
         """Calculate formality score (0.0 = casual, 1.0 = formal)"""
-        formal_words = ['therefore', 'furthermore', 'consequently', 'moreover', 
-                       'additionally', 'specifically', 'accordingly']
-        casual_words = ['yeah', 'gonna', 'wanna', 'gotta', 'kinda', 'sorta', 
-                       'lemme', 'imma', 'cuz', 'cause']
-        
-        words = re.findall(r'\b\w+\b', text.lower())
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
         if not words:
             return 0.5
         
-        formal_count = sum(1 for w in words if w in formal_words)
-        casual_count = sum(1 for w in words if w in casual_words)
+        formal_count = sum(1 for w in words if w in _FORMAL_WORDS)
+        casual_count = sum(1 for w in words if w in _CASUAL_WORDS)
         
         total = formal_count + casual_count
         if total == 0:
@@ -142,16 +158,12 @@ class StyleExtractor:
         
         return formal_count / total
     
-    def _detect_emotional_tone(self, text: str) -> str:
+    def _detect_emotional_tone(self, text: str, words: Optional[List[str]] = None) -> str:
         """Detect emotional tone"""
-        positive_words = ['great', 'excellent', 'wonderful', 'amazing', 'love', 
-                         'happy', 'excited', 'fantastic', 'brilliant']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'sad', 'angry', 
-                         'frustrated', 'disappointed', 'worried']
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        positive_count = sum(1 for w in words if w in positive_words)
-        negative_count = sum(1 for w in words if w in negative_words)
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
+        positive_count = sum(1 for w in words if w in _POSITIVE_WORDS)
+        negative_count = sum(1 for w in words if w in _NEGATIVE_WORDS)
         
         if positive_count > negative_count * 1.5:
             return 'positive'
@@ -160,7 +172,7 @@ class StyleExtractor:
         else:
             return 'neutral'
     
-    def _extract_common_phrases(self, text: str, provider: str) -> List[str]:
+    def _extract_common_phrases(self, text: str, provider: str, words: Optional[List[str]] = None) -> List[str]:
         """Extract common phrases from text"""
         # Look for provider-specific phrases first
         provider_phrases = self.provider_phrases.get(provider.lower(), [])
@@ -172,7 +184,8 @@ class StyleExtractor:
                 found_phrases.append(phrase)
         
         # Also extract common 2-3 word phrases
-        words = re.findall(r'\b\w+\b', text_lower)
+        if words is None:
+            words = _WORD_RE.findall(text_lower)
         bigrams = [' '.join(words[i:i+2]) for i in range(len(words)-1)]
         trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
         
@@ -184,9 +197,10 @@ class StyleExtractor:
         # Combine provider phrases with common phrases
         return list(set(found_phrases + common))[:10]
     
-    def _analyze_sentence_structure(self, text: str) -> str:
+    def _analyze_sentence_structure(self, text: str, sentences: Optional[List[str]] = None) -> str:
         """Analyze sentence structure pattern"""
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
         if not sentences:
             return 'declarative'
         
@@ -201,9 +215,10 @@ class StyleExtractor:
         else:
             return 'declarative'
     
-    def _analyze_pacing(self, text: str) -> str:
+    def _analyze_pacing(self, text: str, sentences: Optional[List[str]] = None) -> str:
         """Analyze pacing (fast, moderate, deliberate)"""
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
         if not sentences:
             return 'moderate'
         
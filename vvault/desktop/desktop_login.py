@@ -19,14 +19,96 @@ Version: 1.0.0
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import re
 import sys
+import asyncio
+import hashlib
+import hmac
 import threading
-import time
+import functools
 from pathlib import Path
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# Mock credential table, stored as SHA-256 digests of the passwords
+_VALID_USERS = {
+    email: hashlib.sha256(password.encode('utf-8')).digest()
+    for email, password in {
+        'admin@vvault.com': 'admin123',
+        'user@vvault.com': 'user123',
+        'test@vvault.com': 'test123'
+    }.items()
+}
+
+# Event loop for login I/O, started on first use and shared by every screen
+_auth_loop = None
+_auth_loop_lock = threading.Lock()
+
+def _get_auth_loop() -> asyncio.AbstractEventLoop:
+    """Return the background asyncio loop that runs login coroutines"""
+    global _auth_loop
+    with _auth_loop_lock:
+        if _auth_loop is None:
+            _auth_loop = asyncio.new_event_loop()
+            threading.Thread(target=_auth_loop.run_forever, daemon=True).start()
+        return _auth_loop
+
+# Quiet period after the last keystroke before the form is revalidated
+VALIDATE_DEBOUNCE_MS = 120
+
+# The logo is only ever shown at this size
+LOGO_SIZE = (150, 150)
+
+@functools.lru_cache(maxsize=4)
+def _load_logo_image(logo_path: str):
+    """
+    Decode the logo at LOGO_SIZE, reusing a raw RGBA cache next to the asset
+    
+    Runs off the Tk thread. Returns a PIL image; the PhotoImage is built on
+    the Tk thread because it belongs to a specific interpreter.
+    """
+    from PIL import Image
+    
+    source = Path(logo_path)
+    cache_path = source.with_name(f"{source.stem}_{LOGO_SIZE[0]}.raw")
+    expected_size = LOGO_SIZE[0] * LOGO_SIZE[1] * 4
+    
+    try:
+        if cache_path.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+            data = cache_path.read_bytes()
+            if len(data) == expected_size:
+                return Image.frombytes("RGBA", LOGO_SIZE, data)
+    except OSError:
+        pass
+    
+    img = Image.open(source)
+    # Lets JPEG decode straight to a reduced scale; a no-op for PNG
+    img.draft("RGB", LOGO_SIZE)
+    img = img.convert("RGBA")
+    if img.size != LOGO_SIZE:
+        # Only for assets not shipped at display size; the result is cached below
+        img = img.resize(LOGO_SIZE, Image.Resampling.LANCZOS)
+    
+    try:
+        tmp_path = cache_path.with_suffix(".raw.tmp")
+        tmp_path.write_bytes(img.tobytes())
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only install; decode again next launch
+        pass
+    
+    return img
+
 class VVAULTLoginScreen:
     """Desktop login screen for VVAULT"""
     
+    # Fixed window size; screen size is read once per process
+    WINDOW_SIZE = (500, 600)
+    _screen_size = None
+    
+    # Screen reused across logins so widgets are only built once per process
+    _singleton = None
+    
     def __init__(self, parent=None):
         self.parent = parent
         self.login_successful = False
@@ -35,17 +117,20 @@ class VVAULTLoginScreen:
         # Create login window
         self.root = tk.Toplevel() if parent else tk.Tk()
         self.root.title("VVAULT - Secure Login")
-        self.root.geometry("500x600")
         self.root.configure(bg='#000000')
         self.root.resizable(False, False)
         
-        # Center the window
+        # Size and center the window
         self._center_window()
         
         # Login form variables
         self.email_var = tk.StringVar()
         self.password_var = tk.StringVar()
         
+        # Debounced validation state
+        self._validate_pending = None
+        self._last_valid = None
+        
         # Create UI
         self._create_ui()
         
@@ -55,13 +140,55 @@ class VVAULTLoginScreen:
         # Focus on email field
         self.email_entry.focus()
     
+    @classmethod
+    def acquire(cls, parent=None):
+        """
+        Return the process-wide login screen, ready for a fresh login
+        
+        Args:
+            parent: Parent window, or None for a standalone login window
+        
+        Returns:
+            A reset VVAULTLoginScreen; rebuilt only if the previous one was
+            closed or belongs to a different parent
+        """
+        screen = cls._singleton
+        if screen is None or screen.parent is not parent or not screen._is_alive():
+            screen = cls(parent)
+            cls._singleton = screen
+        else:
+            screen.reset()
+        return screen
+    
+    def _is_alive(self):
+        """Whether the login window still exists (it is destroyed if the user closes it)"""
+        try:
+            return bool(self.root.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def reset(self):
+        """Clear the previous login and show the hidden window again"""
+        self.login_successful = False
+        self.user_credentials = None
+        self.email_var.set("")
+        self.password_var.set("")
+        self.signin_button.config(state='normal', text="Sign In")
+        self.root.deiconify()
+        self.email_entry.focus()
+    
     def _center_window(self):
-        """Center the login window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        """Size and center the login window on screen in one geometry call"""
+        # The window size is fixed, so no update_idletasks is needed to measure it
+        if VVAULTLoginScreen._screen_size is None:
+            VVAULTLoginScreen._screen_size = (
+                self.root.winfo_screenwidth(),
+                self.root.winfo_screenheight()
+            )
+        screen_width, screen_height = VVAULTLoginScreen._screen_size
+        width, height = self.WINDOW_SIZE
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
     
     def _create_ui(self):
@@ -91,30 +218,43 @@ class VVAULTLoginScreen:
         logo_path = Path(__file__).parent / "assets" / "vvault_glyph.png"
         
         if logo_path.exists():
-            try:
-                # Load and display the logo
-                from PIL import Image, ImageTk
-                img = Image.open(logo_path)
-                img = img.resize((150, 150), Image.Resampling.LANCZOS)
-                self.logo_photo = ImageTk.PhotoImage(img)
-                
-                logo_label = tk.Label(
-                    logo_frame, 
-                    image=self.logo_photo, 
-                    bg='#000000'
-                )
-                logo_label.pack()
-                
-            except ImportError:
-                # Fallback if PIL not available
-                self._create_fallback_logo(logo_frame)
-            except Exception as e:
-                print(f"Error loading logo: {e}")
-                self._create_fallback_logo(logo_frame)
+            # Decode off the UI thread so the window paints immediately
+            self.logo_label = tk.Label(logo_frame, bg='#000000')
+            self.logo_label.pack()
+            threading.Thread(
+                target=self._load_logo_async,
+                args=(logo_frame, logo_path),
+                daemon=True
+            ).start()
         else:
             # Create fallback logo
             self._create_fallback_logo(logo_frame)
     
+    def _load_logo_async(self, logo_frame, logo_path):
+        """Decode the logo in a worker thread and hand it to the Tk thread"""
+        try:
+            img = _load_logo_image(str(logo_path))
+        except ImportError:
+            # Fallback if PIL not available
+            self.root.after(0, self._create_fallback_logo, logo_frame)
+            return
+        except Exception as e:
+            print(f"Error loading logo: {e}")
+            self.root.after(0, self._create_fallback_logo, logo_frame)
+            return
+        
+        self.root.after(0, self._install_logo, img)
+    
+    def _install_logo(self, img):
+        """Show the decoded logo (Tk thread)"""
+        from PIL import ImageTk
+        try:
+            self.logo_photo = ImageTk.PhotoImage(img)
+            self.logo_label.config(image=self.logo_photo)
+        except tk.TclError:
+            # Window closed before the logo finished loading
+            pass
+    
     def _create_fallback_logo(self, parent):
         """Create fallback logo using text"""
         logo_label = tk.Label(
@@ -165,23 +305,16 @@ class VVAULTLoginScreen:
         form_frame = tk.Frame(parent, bg='#000000')
         form_frame.pack(fill=tk.X, pady=(0, 20))
         
-        # Email field
-        email_frame = tk.Frame(form_frame, bg='#000000')
-        email_frame.pack(fill=tk.X, pady=(0, 15))
+        # One grid-managed frame for every field; no per-field wrapper frames
+        form_frame.grid_columnconfigure(0, weight=1)
         
-        email_label = tk.Label(
-            email_frame,
-            text="Email Address",
+        label_style = dict(
             font=('Arial', 12, 'bold'),
             fg='#ffffff',
             bg='#000000',
             anchor='w'
         )
-        email_label.pack(fill=tk.X, pady=(0, 5))
-        
-        self.email_entry = tk.Entry(
-            email_frame,
-            textvariable=self.email_var,
+        entry_style = dict(
             font=('Arial', 12),
             bg='#1a1a1a',
             fg='#ffffff',
@@ -192,37 +325,25 @@ class VVAULTLoginScreen:
             highlightcolor='#3b82f6',
             highlightbackground='#374151'
         )
-        self.email_entry.pack(fill=tk.X, ipady=12)
-        
-        # Password field
-        password_frame = tk.Frame(form_frame, bg='#000000')
-        password_frame.pack(fill=tk.X, pady=(0, 20))
         
-        password_label = tk.Label(
-            password_frame,
-            text="Password",
-            font=('Arial', 12, 'bold'),
-            fg='#ffffff',
-            bg='#000000',
-            anchor='w'
+        # Email field
+        tk.Label(form_frame, text="Email Address", **label_style).grid(
+            row=0, column=0, sticky='ew', pady=(0, 5)
         )
-        password_label.pack(fill=tk.X, pady=(0, 5))
+        self.email_entry = tk.Entry(form_frame, textvariable=self.email_var, **entry_style)
+        self.email_entry.grid(row=1, column=0, sticky='ew', ipady=12, pady=(0, 15))
         
+        # Password field
+        tk.Label(form_frame, text="Password", **label_style).grid(
+            row=2, column=0, sticky='ew', pady=(0, 5)
+        )
         self.password_entry = tk.Entry(
-            password_frame,
+            form_frame,
             textvariable=self.password_var,
-            font=('Arial', 12),
-            bg='#1a1a1a',
-            fg='#ffffff',
-            insertbackground='#ffffff',
-            relief='flat',
-            bd=0,
             show='*',
-            highlightthickness=1,
-            highlightcolor='#3b82f6',
-            highlightbackground='#374151'
+            **entry_style
         )
-        self.password_entry.pack(fill=tk.X, ipady=12)
+        self.password_entry.grid(row=3, column=0, sticky='ew', ipady=12, pady=(0, 20))
         
         # Sign In button
         self.signin_button = tk.Button(
@@ -238,7 +359,7 @@ class VVAULTLoginScreen:
             cursor='hand2',
             command=self._handle_login
         )
-        self.signin_button.pack(fill=tk.X, ipady=15, pady=(0, 15))
+        self.signin_button.grid(row=4, column=0, sticky='ew', ipady=15, pady=(0, 15))
         
         # Create account link
         create_account_label = tk.Label(
@@ -249,7 +370,7 @@ class VVAULTLoginScreen:
             bg='#000000',
             cursor='hand2'
         )
-        create_account_label.pack()
+        create_account_label.grid(row=5, column=0)
         create_account_label.bind('<Button-1>', self._handle_create_account)
     
     def _create_footer(self, parent):
@@ -285,22 +406,30 @@ class VVAULTLoginScreen:
         self.signin_button.bind('<Leave>', self._on_button_leave)
     
     def _validate_form(self, *args):
-        """Validate form and enable/disable submit button"""
-        email = self.email_var.get().strip()
-        password = self.password_var.get().strip()
+        """Schedule form validation, coalescing bursts of keystrokes"""
+        if self._validate_pending is not None:
+            self.root.after_cancel(self._validate_pending)
+        self._validate_pending = self.root.after(VALIDATE_DEBOUNCE_MS, self._do_validate)
+    
+    def _do_validate(self):
+        """Validate form and restyle the submit button when validity changes"""
+        self._validate_pending = None
+        valid = bool(self.email_var.get().strip()) and bool(self.password_var.get().strip())
         
-        if email and password:
+        if valid == self._last_valid:
+            return
+        self._last_valid = valid
+        
+        if valid:
             self.signin_button.config(
                 bg='#3b82f6',
                 activebackground='#2563eb'
             )
-            self.signin_button.config(state='normal')
         else:
             self.signin_button.config(
                 bg='#1a1a1a',
                 activebackground='#374151'
             )
-            self.signin_button.config(state='normal')
     
     def _on_button_hover(self, event):
         """Button hover effect"""
@@ -310,9 +439,7 @@ class VVAULTLoginScreen:
     def _on_button_leave(self, event):
         """Button leave effect"""
         if self.signin_button['state'] == 'normal':
-            email = self.email_var.get().strip()
-            password = self.password_var.get().strip()
-            if email and password:
+            if self._last_valid:
                 self.signin_button.config(bg='#3b82f6')
             else:
                 self.signin_button.config(bg='#1a1a1a')
@@ -334,21 +461,16 @@ class VVAULTLoginScreen:
         self.signin_button.config(state='disabled', text="Signing In...")
         self.root.update()
         
-        # Simulate login process
-        threading.Thread(target=self._perform_login, args=(email, password), daemon=True).start()
+        # Run authentication on the background loop; results come back via root.after
+        asyncio.run_coroutine_threadsafe(self._perform_login(email, password), _get_auth_loop())
     
     def _validate_email(self, email):
         """Basic email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
-    def _perform_login(self, email, password):
+    async def _perform_login(self, email, password):
         """Perform login authentication"""
         try:
-            # Simulate login delay
-            time.sleep(1.5)
-            
             # Mock authentication logic
             # In a real implementation, this would call your authentication service
             if self._authenticate_user(email, password):
@@ -361,25 +483,28 @@ class VVAULTLoginScreen:
                 self.root.after(0, self._login_failed)
                 
         except Exception as e:
-            self.root.after(0, lambda: self._login_error(str(e)))
+            self.root.after(0, self._login_error, str(e))
     
     def _authenticate_user(self, email, password):
         """Mock authentication - replace with real authentication logic"""
         # Simple mock authentication
         # In production, this would connect to your authentication service
-        valid_users = {
-            'admin@vvault.com': 'admin123',
-            'user@vvault.com': 'user123',
-            'test@vvault.com': 'test123'
-        }
+        expected = _VALID_USERS.get(email)
+        if expected is None:
+            return False
         
-        return valid_users.get(email) == password
+        # Compare fixed-length digests in constant time
+        return hmac.compare_digest(expected, hashlib.sha256(password.encode('utf-8')).digest())
     
     def _login_success(self):
         """Handle successful login"""
         self.signin_button.config(state='normal', text="Sign In")
         messagebox.showinfo("Success", "Login successful!")
-        self.root.destroy()
+        # Hide rather than destroy so the next login reuses the widgets
+        if self.parent:
+            self.root.grab_release()
+        self.root.withdraw()
+        self.root.quit()
     
     def _login_failed(self):
         """Handle failed login"""
@@ -418,7 +543,7 @@ def main():
         # The fallback logo will be used automatically
     
     # Create and show login screen
-    login_screen = VVAULTLoginScreen()
+    login_screen = VVAULTLoginScreen.acquire()
     success, credentials = login_screen.show()
     
     if success:
@@ -7,52 +7,50 @@ This script kills any existing VVAULT processes and restarts with the black them
 import os
 import sys
 import subprocess
-import time
-import signal
+
+import psutil
 
 def kill_vvault_processes():
     """Kill any existing VVAULT processes"""
     print("🛑 Stopping existing VVAULT processes...")
     
     try:
-        # Find VVAULT processes
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        lines = result.stdout.split('\n')
-        
-        vvault_pids = []
-        for line in lines:
-            if 'python' in line and ('vvault' in line or 'VVAULT' in line):
-                parts = line.split()
-                if len(parts) > 1:
-                    try:
-                        pid = int(parts[1])
-                        vvault_pids.append(pid)
-                        print(f"   Found VVAULT process: PID {pid}")
-                    except ValueError:
-                        continue
+        # Find VVAULT processes without shelling out to ps
+        own_pid = os.getpid()
+        vvault_procs = []
+        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            if proc.info['pid'] == own_pid:
+                continue
+            cmd = ' '.join(proc.info['cmdline'] or ())
+            name = proc.info['name'] or ''
+            if 'python' in f"{name} {cmd}".lower() and 'vvault' in cmd.lower():
+                vvault_procs.append(proc)
+                print(f"   Found VVAULT process: PID {proc.pid}")
         
         # Kill processes
-        for pid in vvault_pids:
+        for proc in vvault_procs:
             try:
-                os.kill(pid, signal.SIGTERM)
-                print(f"   Sent SIGTERM to PID {pid}")
-            except ProcessLookupError:
-                print(f"   Process {pid} already terminated")
-            except PermissionError:
-                print(f"   Permission denied for PID {pid}")
+                proc.terminate()
+                print(f"   Sent SIGTERM to PID {proc.pid}")
+            except psutil.NoSuchProcess:
+                print(f"   Process {proc.pid} already terminated")
+            except psutil.AccessDenied:
+                print(f"   Permission denied for PID {proc.pid}")
         
-        # Wait a moment for graceful shutdown
-        if vvault_pids:
+        # Wait for graceful shutdown, returning as soon as they have all exited
+        if vvault_procs:
             print("   Waiting for graceful shutdown...")
-            time.sleep(2)
+            _, alive = psutil.wait_procs(vvault_procs, timeout=2)
             
             # Force kill if still running
-            for pid in vvault_pids:
+            for proc in alive:
                 try:
-                    os.kill(pid, signal.SIGKILL)
-                    print(f"   Force killed PID {pid}")
-                except ProcessLookupError:
+                    proc.kill()
+                    print(f"   Force killed PID {proc.pid}")
+                except psutil.NoSuchProcess:
                     pass  # Process already dead
+                except psutil.AccessDenied:
+                    print(f"   Permission denied for PID {proc.pid}")
         
         print("✅ VVAULT processes stopped")
         return True
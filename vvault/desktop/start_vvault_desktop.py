@@ -13,7 +13,7 @@ Version: 1.0.0
 
 import os
 import sys
-import subprocess
+import runpy
 from pathlib import Path
 
 def main():
@@ -76,13 +76,15 @@ def main():
     print("🎯 Launching VVAULT Desktop Application...")
     
     try:
-        # Launch the desktop application
+        # Run the launcher in this interpreter rather than starting a second Python
         launcher_script = project_dir / "vvault_launcher.py"
-        subprocess.run([sys.executable, str(launcher_script)], check=True)
+        sys.argv[0] = str(launcher_script)
+        runpy.run_path(str(launcher_script), run_name="__main__")
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error launching VVAULT Desktop: {e}")
-        sys.exit(1)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"❌ Error launching VVAULT Desktop: exited with status {e.code}")
+            sys.exit(1)
     except KeyboardInterrupt:
         print("\n🛑 VVAULT Desktop Application stopped by user")
     except Exception as e:
@@ -35,30 +35,43 @@ def check_environment():
     """Check if the environment is properly set up"""
     print("🔍 Checking VVAULT Environment...")
     
+    # One directory listing answers every top-level existence check
+    try:
+        with os.scandir(PROJECT_DIR) as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
+    
     # Check if we're in the right directory
-    if not os.path.exists(os.path.join(PROJECT_DIR, "vvault_launcher.py")):
+    if "vvault_launcher.py" not in entries:
         print("❌ VVAULT launcher not found. Please run from VVAULT directory.")
         return False
     
     # Check if virtual environment exists
-    venv_path = os.path.join(PROJECT_DIR, "vvault_env")
-    if not os.path.exists(venv_path):
+    if "vvault_env" not in entries:
         print("❌ Virtual environment not found. Please run setup first.")
         return False
     
     # Check if assets exist
     assets_dir = os.path.join(PROJECT_DIR, "assets")
-    if not os.path.exists(assets_dir):
+    if "assets" in entries:
+        with os.scandir(assets_dir) as it:
+            glyph_present = any(entry.name == "vvault_glyph.png" for entry in it)
+    else:
         print("⚠️  Assets directory not found. Creating...")
         os.makedirs(assets_dir, exist_ok=True)
+        glyph_present = False
     
     # Check if VVAULT glyph exists
     glyph_path = os.path.join(assets_dir, "vvault_glyph.png")
-    if not os.path.exists(glyph_path):
+    if not glyph_present:
         print("⚠️  VVAULT glyph not found. Creating...")
         try:
+            from PIL import Image
             from create_vvault_glyph import create_vvault_glyph
             glyph = create_vvault_glyph()
+            # Bake the glyph at the login screen's display size so launches never resample
+            glyph = glyph.resize((150, 150), Image.Resampling.LANCZOS)
             glyph.save(glyph_path, "PNG")
             print("✅ VVAULT glyph created")
         except Exception as e:
@@ -608,7 +608,7 @@ For support and documentation, visit the VVAULT project repository.
         try:
             # Show login screen first
             self.log_output("🔐 VVAULT Login Required")
-            login_screen = VVAULTLoginScreen(self.root)
+            login_screen = VVAULTLoginScreen.acquire(self.root)
             login_success, credentials = login_screen.show()
             
             if not login_success:
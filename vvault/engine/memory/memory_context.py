@@ -5,16 +5,36 @@ Handles STM (Short-Term Memory) and LTM (Long-Term Memory) context building
 
 import os
 import json
+import hashlib
 import logging
+import threading
 import re
+import functools
+import itertools
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from ..orchestration.construct_registry import ConstructRegistry, get_registry
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# One transcript message: "**<time> - <speaker>** [<iso timestamp>]: <content>"
+_MESSAGE_RE = re.compile(
+    r'\*\*(\d+:\d+:\d+ [AP]M \w+) - (\w+)\*\* \[([^\]]+)\]: (.+?)(?=\n\n\*\*|\n\n## |\Z)',
+    re.DOTALL
+)
+
+# Speakers (lowercased) whose messages are the construct's own replies
+_ASSISTANT_SPEAKERS = frozenset({"aurora", "zen", "lin", "katana", "nova", "synth"})
+
+@functools.lru_cache(maxsize=32)
+def _role_for(speaker: str) -> str:
+    """Map a transcript speaker to a chat role; a transcript has only a few speakers"""
+    return "assistant" if speaker.lower() in _ASSISTANT_SPEAKERS else "user"
+
+@dataclass(slots=True)
 class MemoryEntry:
     role: str
     content: str
@@ -33,60 +53,224 @@ class MemoryContext:
     total_messages: int = 0
 
 
+# Parsed transcripts by path. Transcripts are append-only logs, so when one
+# grows only the bytes from its last message onwards need parsing again.
+_TRANSCRIPT_CACHE: Dict[str, "_ParsedTranscript"] = {}
+_TRANSCRIPT_CACHE_MAX = 64
+# Guards _TRANSCRIPT_CACHE; reading and parsing happen outside it
+_TRANSCRIPT_LOCK = threading.Lock()
+
+
+# Bytes before the resume offset that must also be unchanged to resume.
+# Together with the grown size this is a cheap append-only check; an edit
+# further back than this goes unnoticed until the file is parsed in full.
+_RESUME_CHECK_BYTES = 4096
+
+
+@dataclass
+class _ParsedTranscript:
+    mtime_ns: int
+    size: int
+    entries: Tuple[MemoryEntry, ...]
+    resume_offset: int      # byte offset of the last message (or of the text after the last one)
+    entries_before_resume: int
+    check_start: int        # byte offset where the bytes covered by check_digest begin
+    check_digest: Optional[bytes]  # of bytes [check_start, size); None if the file cannot be resumed
+
+
+def _digest(data) -> bytes:
+    """Fingerprint transcript bytes to confirm a later read only appended to them"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _parse_messages(text: str) -> Tuple[List[MemoryEntry], Optional[int]]:
+    """Parse transcript text; also return the character offset of the last message"""
+    entries = []
+    last_start = None
+    
+    for match in _MESSAGE_RE.finditer(text):
+        time_str, speaker, iso_timestamp, message_content = match.groups()
+        
+        entries.append(MemoryEntry(
+            role=_role_for(speaker),
+            content=message_content.strip(),
+            timestamp=iso_timestamp,
+            speaker=speaker,
+            metadata={}
+        ))
+        last_start = match.start()
+    
+    return entries, last_start
+
+
+def _store_transcript(key: str, parsed: _ParsedTranscript):
+    """Cache a parsed transcript, evicting the oldest one when full"""
+    with _TRANSCRIPT_LOCK:
+        if key not in _TRANSCRIPT_CACHE and len(_TRANSCRIPT_CACHE) >= _TRANSCRIPT_CACHE_MAX:
+            _TRANSCRIPT_CACHE.pop(next(iter(_TRANSCRIPT_CACHE)), None)
+        _TRANSCRIPT_CACHE[key] = parsed
+
+
+def _parse_region(
+    key: str,
+    stat: os.stat_result,
+    buf: bytes,
+    buf_start: int,
+    parse_from: int,
+    kept: Tuple[MemoryEntry, ...]
+) -> Tuple[MemoryEntry, ...]:
+    """
+    Parse buf (file bytes from buf_start to EOF) from parse_from onwards and cache the result
+    
+    kept holds the entries that precede parse_from.
+    """
+    text = buf[parse_from - buf_start:].decode('utf-8')
+    new_entries, last_start = _parse_messages(text)
+    entries = kept + tuple(new_entries)
+    
+    if last_start is None:
+        # No message in the parsed region; resume from the same place next time
+        resume_offset = parse_from
+        entries_before_resume = len(kept)
+    else:
+        resume_offset = parse_from + len(text[:last_start].encode('utf-8'))
+        entries_before_resume = len(entries) - 1
+    
+    check_start = max(buf_start, resume_offset - _RESUME_CHECK_BYTES)
+    _store_transcript(key, _ParsedTranscript(
+        mtime_ns=stat.st_mtime_ns,
+        size=buf_start + len(buf),
+        entries=entries,
+        resume_offset=resume_offset,
+        entries_before_resume=entries_before_resume,
+        check_start=check_start,
+        check_digest=_digest(memoryview(buf)[check_start - buf_start:])
+    ))
+    return entries
+
+
+def _load_transcript_entries(transcript_path: Path, stat: os.stat_result) -> Tuple[MemoryEntry, ...]:
+    """
+    Return a transcript's entries, parsing only what changed since the last call
+    
+    Unchanged files (same mtime and size) are served from the cache. When a
+    file grew and the bytes around its last parsed message are unchanged,
+    only the file from that point on is read, and it is re-parsed from the
+    start of the last message, the only earlier message an append can
+    extend. Anything else is read and parsed in full.
+    """
+    key = str(transcript_path)
+    with _TRANSCRIPT_LOCK:
+        cached = _TRANSCRIPT_CACHE.get(key)
+    if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached.entries
+    
+    if cached and cached.check_digest is not None and stat.st_size > cached.size:
+        with open(transcript_path, 'rb') as f:
+            f.seek(cached.check_start)
+            tail = f.read()
+        
+        checked = cached.size - cached.check_start
+        if (len(tail) > checked and b'\r' not in tail
+                and _digest(memoryview(tail)[:checked]) == cached.check_digest):
+            return _parse_region(
+                key, stat, tail, cached.check_start, cached.resume_offset,
+                cached.entries[:cached.entries_before_resume]
+            )
+    
+    data = transcript_path.read_bytes()
+    
+    if b'\r' in data:
+        # Normalize line endings as read_text() would. Offsets into the
+        # normalized text no longer match the file, so always parse in full.
+        text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        entries = tuple(_parse_messages(text)[0])
+        _store_transcript(key, _ParsedTranscript(
+            mtime_ns=stat.st_mtime_ns,
+            size=len(data),
+            entries=entries,
+            resume_offset=0,
+            entries_before_resume=0,
+            check_start=0,
+            check_digest=None
+        ))
+        return entries
+    
+    return _parse_region(key, stat, data, 0, 0, ())
+
+
 class MemoryContextBuilder:
     """Builds memory context from transcripts for LLM inference"""
     
-    def __init__(self, vvault_root: Optional[str] = None, max_stm: int = 20, max_ltm: int = 10):
+    def __init__(
+        self,
+        vvault_root: Optional[str] = None,
+        max_stm: int = 20,
+        max_ltm: int = 10,
+        registry: Optional[ConstructRegistry] = None
+    ):
         self.vvault_root = Path(vvault_root) if vvault_root else Path(__file__).parent.parent.parent
         self.instances_dir = self.vvault_root / "instances"
         self.max_stm = max_stm
         self.max_ltm = max_ltm
+        self._registry = registry
+        self._registry_lock = threading.Lock()
+    
+    @property
+    def registry(self) -> ConstructRegistry:
+        """
+        Construct registry used to resolve shards
+        
+        Unless one was injected, this is the shared default registry when it
+        covers the same vvault_root, otherwise a private one over vvault_root.
+        """
+        if self._registry is None:
+            with self._registry_lock:
+                if self._registry is None:
+                    shared = get_registry(str(self.vvault_root))
+                    if shared.vvault_root.resolve() == self.vvault_root.resolve():
+                        self._registry = shared
+                    else:
+                        self._registry = ConstructRegistry(str(self.vvault_root))
+        return self._registry
     
     def _find_transcript(self, construct_id: str) -> Optional[Path]:
         """Find the transcript file for a construct"""
-        if not self.instances_dir.exists():
+        # The registry usually knows the construct's shard
+        manifest = self.registry.get(construct_id)
+        if manifest:
+            transcript = self.instances_dir / manifest.shard / construct_id / "chatty" / f"chat_with_{construct_id}.md"
+            if transcript.exists():
+                return transcript
+        
+        # Unregistered constructs, or a transcript outside the registered
+        # shard: search the shards
+        try:
+            with os.scandir(self.instances_dir) as it:
+                shard_paths = [e.path for e in it if e.name.startswith("shard_") and e.is_dir()]
+        except FileNotFoundError:
             return None
         
-        for shard in self.instances_dir.iterdir():
-            if shard.is_dir() and shard.name.startswith("shard_"):
-                construct_path = shard / construct_id
-                chatty_dir = construct_path / "chatty"
-                if chatty_dir.exists():
-                    transcript = chatty_dir / f"chat_with_{construct_id}.md"
-                    if transcript.exists():
-                        return transcript
+        for shard_path in shard_paths:
+            # A missing chatty directory also makes the transcript missing
+            transcript = Path(shard_path) / construct_id / "chatty" / f"chat_with_{construct_id}.md"
+            if transcript.exists():
+                return transcript
         
         return None
     
-    def _parse_transcript(self, transcript_path: Path) -> List[MemoryEntry]:
-        """Parse a markdown transcript into memory entries"""
-        entries = []
+    def _parse_transcript(self, transcript_path: Path) -> Tuple[MemoryEntry, ...]:
+        """
+        Parse a markdown transcript into memory entries (incrementally as it grows)
         
+        Returns the shared cached tuple; callers slice it rather than copy it.
+        """
         try:
-            content = transcript_path.read_text()
+            stat = transcript_path.stat()
+            return _load_transcript_entries(transcript_path, stat)
         except Exception as e:
             logger.error(f"Error reading transcript {transcript_path}: {e}")
-            return entries
-        
-        message_pattern = re.compile(
-            r'\*\*(\d+:\d+:\d+ [AP]M \w+) - (\w+)\*\* \[([^\]]+)\]: (.+?)(?=\n\n\*\*|\n\n## |\Z)',
-            re.DOTALL
-        )
-        
-        for match in message_pattern.finditer(content):
-            time_str, speaker, iso_timestamp, message_content = match.groups()
-            
-            role = "user" if speaker.lower() not in ["aurora", "zen", "lin", "katana", "nova", "synth"] else "assistant"
-            
-            entries.append(MemoryEntry(
-                role=role,
-                content=message_content.strip(),
-                timestamp=iso_timestamp,
-                speaker=speaker,
-                metadata={}
-            ))
-        
-        return entries
+            return ()
     
     def build_context(self, construct_id: str, thread_id: Optional[str] = None) -> MemoryContext:
         """Build memory context for a construct conversation"""
@@ -102,9 +286,15 @@ class MemoryContextBuilder:
                 total_messages=0
             )
         
+        # Only the windows are copied out of the cached history, never the whole of it
         all_entries = self._parse_transcript(transcript_path)
-        stm_window = all_entries[-self.max_stm:] if len(all_entries) > self.max_stm else all_entries
-        ltm_entries = all_entries[:-self.max_stm][:self.max_ltm] if len(all_entries) > self.max_stm else []
+        total = len(all_entries)
+        if self.max_stm and total > self.max_stm:
+            stm_window = list(all_entries[total - self.max_stm:])
+            ltm_entries = list(all_entries[:min(self.max_ltm, total - self.max_stm)])
+        else:
+            stm_window = list(all_entries)
+            ltm_entries = []
         
         return MemoryContext(
             construct_id=construct_id,
@@ -112,20 +302,30 @@ class MemoryContextBuilder:
             stm_window=stm_window,
             ltm_entries=ltm_entries,
             summaries=[],
-            total_messages=len(all_entries)
+            total_messages=total
         )
     
     def format_for_llm(self, context: MemoryContext) -> List[Dict[str, str]]:
         """Format memory context as LLM message history"""
-        messages = []
+        return [{"role": entry.role, "content": entry.content} for entry in context.stm_window]
+    
+    def build_llm_messages(self, construct_id: str) -> List[Dict[str, str]]:
+        """
+        Build the LLM message history straight from the cached transcript
         
-        for entry in context.stm_window:
-            messages.append({
-                "role": entry.role,
-                "content": entry.content
-            })
+        Equivalent to format_for_llm(build_context(...)) for callers that do
+        not need the MemoryContext itself.
+        """
+        transcript_path = self._find_transcript(construct_id)
+        if not transcript_path:
+            return []
         
-        return messages
+        all_entries = self._parse_transcript(transcript_path)
+        start = len(all_entries) - self.max_stm if self.max_stm and len(all_entries) > self.max_stm else 0
+        return [
+            {"role": entry.role, "content": entry.content}
+            for entry in itertools.islice(all_entries, start, None)
+        ]
     
     def get_recent_messages(self, construct_id: str, count: int = 10) -> List[MemoryEntry]:
         """Get the most recent messages for a construct"""
@@ -134,10 +334,14 @@ class MemoryContextBuilder:
 
 
 _default_builder: Optional[MemoryContextBuilder] = None
+_default_lock = threading.Lock()
 
 def get_memory_builder(vvault_root: Optional[str] = None) -> MemoryContextBuilder:
     """Get the default memory context builder singleton"""
     global _default_builder
     if _default_builder is None:
-        _default_builder = MemoryContextBuilder(vvault_root)
+        # Double-checked so concurrent first calls build only one instance
+        with _default_lock:
+            if _default_builder is None:
+                _default_builder = MemoryContextBuilder(vvault_root)
     return _default_builder
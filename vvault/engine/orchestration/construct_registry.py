@@ -6,14 +6,46 @@ Manages construct loading, lookup, and metadata
 import os
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Upper bound on threads reading construct metadata during load_all
+LOAD_WORKERS = 16
+
+# Bumped whenever the on-disk registry index layout changes
+REGISTRY_INDEX_VERSION = 1
+
+def _read_json(path: Path) -> Any:
+    """Read and decode a JSON file, preferring orjson"""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return a path's mtime in nanoseconds, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+@dataclass(slots=True)
 class ConstructManifest:
     construct_id: str
     display_name: str
@@ -30,22 +62,38 @@ class ConstructManifest:
     shard: str = "shard_0000"
 
 
+_MANIFEST_FIELDS = tuple(f.name for f in fields(ConstructManifest))
+
+
 class ConstructRegistry:
     """Registry for all constructs in VVAULT"""
     
     def __init__(self, vvault_root: Optional[str] = None):
         self.vvault_root = Path(vvault_root) if vvault_root else Path(__file__).parent.parent.parent
         self.instances_dir = self.vvault_root / "instances"
+        # The registry index is internal, so prefer the faster MessagePack encoding
+        self.legacy_index_file = self.instances_dir / ".registry_index.json"
+        self.index_file = (
+            self.instances_dir / ".registry_index.mpk" if MSGPACK_AVAILABLE else self.legacy_index_file
+        )
         self._cache: Dict[str, ConstructManifest] = {}
         self._loaded = False
+        # Serializes loads; readers keep using the previous _cache until a
+        # load swaps in the new one
+        self._load_lock = threading.Lock()
+        
+        # Secondary indexes, rebuilt whenever _cache is
+        self._by_tag: Dict[str, Tuple[ConstructManifest, ...]] = {}
+        self._system: Tuple[ConstructManifest, ...] = ()
     
     def _discover_shards(self) -> List[Path]:
         """Discover all shard directories"""
-        shards = []
-        if self.instances_dir.exists():
-            for item in self.instances_dir.iterdir():
-                if item.is_dir() and item.name.startswith("shard_"):
-                    shards.append(item)
+        # DirEntry.is_dir() reuses the type from readdir instead of a stat per entry
+        try:
+            with os.scandir(self.instances_dir) as it:
+                shards = [Path(e.path) for e in it if e.name.startswith("shard_") and e.is_dir()]
+        except FileNotFoundError:
+            return []
         return sorted(shards)
     
     def _load_construct_metadata(self, construct_path: Path) -> Optional[ConstructManifest]:
@@ -57,8 +105,7 @@ class ConstructRegistry:
             return None
         
         try:
-            with open(metadata_file, 'r') as f:
-                data = json.load(f)
+            data = _read_json(metadata_file)
             
             return ConstructManifest(
                 construct_id=data.get('construct_id', construct_path.name),
@@ -84,20 +131,145 @@ class ConstructRegistry:
         if self._loaded and not force:
             return self._cache
         
-        self._cache.clear()
+        with self._load_lock:
+            # Another thread may have finished loading while this one waited
+            if self._loaded and not force:
+                return self._cache
+            return self._load_all_locked(force)
+    
+    def _load_all_locked(self, force: bool) -> Dict[str, ConstructManifest]:
+        """Load all constructs; the caller holds _load_lock"""
+        cache: Dict[str, ConstructManifest] = {}
+        
+        shards = self._discover_shards()
         
-        for shard in self._discover_shards():
-            for construct_dir in shard.iterdir():
-                if construct_dir.is_dir() and not construct_dir.name.startswith('.'):
-                    manifest = self._load_construct_metadata(construct_dir)
-                    if manifest:
-                        self._cache[manifest.construct_id] = manifest
-                        logger.debug(f"Loaded construct: {manifest.construct_id}")
+        # Reuse the aggregated index when no shard or metadata file has changed
+        if not force:
+            manifests = self._load_index(shards)
+            if manifests is not None:
+                for manifest in manifests:
+                    cache[manifest.construct_id] = manifest
+                self._cache = cache
+                self._build_indexes()
+                self._loaded = True
+                logger.info(f"Loaded {len(self._cache)} constructs from registry index")
+                return self._cache
+        
+        construct_dirs = []
+        for shard in shards:
+            with os.scandir(shard) as it:
+                construct_dirs.extend(
+                    Path(e.path) for e in it if not e.name.startswith('.') and e.is_dir()
+                )
+        
+        # Fingerprint before reading, so a concurrent edit invalidates the index
+        fingerprint = self._fingerprint(shards, construct_dirs)
+        
+        # Metadata reads are I/O-bound; map() keeps shard order for duplicate IDs
+        if len(construct_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(construct_dirs))) as executor:
+                manifests = list(executor.map(self._load_construct_metadata, construct_dirs))
+        else:
+            manifests = [self._load_construct_metadata(d) for d in construct_dirs]
+        
+        for manifest in manifests:
+            if manifest:
+                cache[manifest.construct_id] = manifest
+                logger.debug(f"Loaded construct: {manifest.construct_id}")
+        
+        self._cache = cache
+        self._write_index(fingerprint)
+        self._build_indexes()
         
         self._loaded = True
         logger.info(f"Loaded {len(self._cache)} constructs from registry")
         return self._cache
     
+    def _build_indexes(self):
+        """Index the loaded manifests by tag and system flag"""
+        by_tag: Dict[str, List[ConstructManifest]] = {}
+        for manifest in self._cache.values():
+            for tag in dict.fromkeys(manifest.tags):
+                by_tag.setdefault(tag, []).append(manifest)
+        
+        self._by_tag = {tag: tuple(manifests) for tag, manifests in by_tag.items()}
+        self._system = tuple(m for m in self._cache.values() if m.is_system)
+    
+    def _fingerprint(self, shards: List[Path], construct_dirs: List[Path]) -> Dict[str, Any]:
+        """
+        Capture the mtimes that decide whether the registry index is current
+        
+        Shard mtimes change when constructs are added or removed; each
+        construct's metadata.json mtime (None while missing) covers edits.
+        """
+        return {
+            'shards': {shard.name: _mtime_ns(shard) for shard in shards},
+            'metadata': {
+                f"{construct_dir.parent.name}/{construct_dir.name}":
+                    _mtime_ns(construct_dir / "config" / "metadata.json")
+                for construct_dir in construct_dirs
+            }
+        }
+    
+    def _load_index(self, shards: List[Path]) -> Optional[List[ConstructManifest]]:
+        """Return manifests from the registry index, or None if it is missing or stale"""
+        index_file = self.index_file
+        if not index_file.exists() and self.legacy_index_file.exists():
+            # Written before msgpack was available; still valid if its fingerprint matches
+            index_file = self.legacy_index_file
+        
+        try:
+            if index_file.suffix == '.mpk':
+                index = msgpack.unpackb(index_file.read_bytes(), raw=False)
+            else:
+                index = _read_json(index_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable registry index {index_file}: {e}")
+            return None
+        
+        if not isinstance(index, dict) or index.get('version') != REGISTRY_INDEX_VERSION:
+            return None
+        
+        if index.get('shards') != {shard.name: _mtime_ns(shard) for shard in shards}:
+            return None
+        
+        metadata = index.get('metadata', {})
+        for relative_dir, mtime in metadata.items():
+            if _mtime_ns(self.instances_dir / relative_dir / "config" / "metadata.json") != mtime:
+                return None
+        
+        try:
+            return [ConstructManifest(**entry) for entry in index.get('manifests', [])]
+        except TypeError as e:
+            logger.warning(f"Ignoring malformed registry index {self.index_file}: {e}")
+            return None
+    
+    def _write_index(self, fingerprint: Dict[str, Any]):
+        """Persist the loaded manifests with their fingerprint in one file"""
+        if not self.instances_dir.exists():
+            return
+        
+        index = {
+            'version': REGISTRY_INDEX_VERSION,
+            **fingerprint,
+            'manifests': [asdict(manifest) for manifest in self._cache.values()]
+        }
+        if MSGPACK_AVAILABLE:
+            data = msgpack.packb(index, use_bin_type=True)
+        elif ORJSON_AVAILABLE:
+            data = orjson.dumps(index)
+        else:
+            data = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        
+        tmp_path = self.index_file.with_suffix(self.index_file.suffix + '.tmp')
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.index_file)
+        except OSError as e:
+            logger.warning(f"Could not write registry index {self.index_file}: {e}")
+    
     def get(self, construct_id: str) -> Optional[ConstructManifest]:
         """Get a construct by ID"""
         if not self._loaded:
@@ -119,11 +291,15 @@ class ConstructRegistry:
     
     def list_by_tag(self, tag: str) -> List[ConstructManifest]:
         """List constructs with a specific tag"""
-        return [c for c in self.list_all() if tag in c.tags]
+        if not self._loaded:
+            self.load_all()
+        return list(self._by_tag.get(tag, ()))
     
     def get_system_constructs(self) -> List[ConstructManifest]:
         """Get all system constructs (like Aurora)"""
-        return [c for c in self.list_all() if c.is_system]
+        if not self._loaded:
+            self.load_all()
+        return list(self._system)
     
     def to_dict(self, construct_id: str) -> Optional[Dict[str, Any]]:
         """Get construct manifest as dictionary"""
@@ -131,28 +307,18 @@ class ConstructRegistry:
         if not manifest:
             return None
         
-        return {
-            'construct_id': manifest.construct_id,
-            'display_name': manifest.display_name,
-            'role': manifest.role,
-            'version': manifest.version,
-            'created_at': manifest.created_at,
-            'is_primary': manifest.is_primary,
-            'is_system': manifest.is_system,
-            'verification_status': manifest.verification_status,
-            'pocketverse_anchored': manifest.pocketverse_anchored,
-            'tags': manifest.tags,
-            'capabilities': manifest.capabilities,
-            'description': manifest.description,
-            'shard': manifest.shard
-        }
+        return {name: getattr(manifest, name) for name in _MANIFEST_FIELDS}
 
 
 _default_registry: Optional[ConstructRegistry] = None
+_default_lock = threading.Lock()
 
 def get_registry(vvault_root: Optional[str] = None) -> ConstructRegistry:
     """Get the default construct registry singleton"""
     global _default_registry
     if _default_registry is None:
-        _default_registry = ConstructRegistry(vvault_root)
+        # Double-checked so concurrent first calls build only one instance
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = ConstructRegistry(vvault_root)
     return _default_registry
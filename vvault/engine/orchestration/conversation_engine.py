@@ -6,9 +6,9 @@ Main orchestration class that ties together persona, memory, and LLM inference
 import os
 import json
 import logging
-import requests
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 
@@ -16,8 +16,17 @@ from .construct_registry import ConstructRegistry, get_registry
 from ..persona.persona_loader import PersonaLoader, get_persona_loader
 from ..memory.memory_context import MemoryContextBuilder, get_memory_builder, MemoryContext
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# How long Ollama keeps the model loaded between turns
+OLLAMA_KEEP_ALIVE = "30m"
+
 @dataclass
 class ConversationResponse:
     success: bool
@@ -50,7 +59,18 @@ class ConversationEngine:
         
         self.registry = get_registry(str(self.vvault_root))
         self.persona_loader = get_persona_loader(str(self.vvault_root))
-        self.memory_builder = MemoryContextBuilder(str(self.vvault_root), max_stm, max_ltm)
+        self.memory_builder = MemoryContextBuilder(str(self.vvault_root), max_stm, max_ltm, self.registry)
+        
+        # Keep-alive connection to Ollama, opened on the first LLM call
+        self._session = None
+    
+    @property
+    def _http(self):
+        """HTTP session for Ollama; requests is only imported once inference is needed"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
     
     def process_message(
         self,
@@ -81,19 +101,7 @@ class ConversationEngine:
             )
         
         system_prompt = self.persona_loader.build_full_prompt(construct_id)
-        
-        messages = []
-        memory_context = None
-        
-        if include_history:
-            memory_context = self.memory_builder.build_context(construct_id)
-            history = self.memory_builder.format_for_llm(memory_context)
-            messages.extend(history)
-        
-        messages.append({
-            "role": "user",
-            "content": user_message
-        })
+        messages, memory_context = self._build_messages(construct_id, user_message, include_history)
         
         try:
             response_text = self._call_ollama(system_prompt, messages)
@@ -117,25 +125,101 @@ class ConversationEngine:
             traits_applied=persona.traits
         )
     
+    def process_message_stream(
+        self,
+        construct_id: str,
+        user_message: str,
+        include_history: bool = True
+    ) -> Iterator[str]:
+        """
+        Process a user message and yield the construct's reply as it is generated.
+        
+        Args:
+            construct_id: The construct to converse with
+            user_message: The user's message
+            include_history: Whether to include conversation history
+            
+        Returns:
+            Iterator over reply fragments; "".join() them for the full reply
+        
+        Raises:
+            RuntimeError: If the persona cannot be loaded or Ollama reports an error
+        """
+        persona = self.persona_loader.load(construct_id)
+        if not persona:
+            raise RuntimeError(f"Could not load persona for construct: {construct_id}")
+        
+        system_prompt = self.persona_loader.build_full_prompt(construct_id)
+        
+        # No MemoryContext is returned here, so go straight to the message list
+        messages = self.memory_builder.build_llm_messages(construct_id) if include_history else []
+        messages.append({
+            "role": "user",
+            "content": user_message
+        })
+        
+        yield from self._stream_ollama(system_prompt, messages)
+    
+    def _build_messages(
+        self,
+        construct_id: str,
+        user_message: str,
+        include_history: bool
+    ) -> Tuple[List[Dict[str, str]], Optional[MemoryContext]]:
+        """Build the chat message list (history plus the new user message)"""
+        messages = []
+        memory_context = None
+        
+        if include_history:
+            memory_context = self.memory_builder.build_context(construct_id)
+            history = self.memory_builder.format_for_llm(memory_context)
+            messages.extend(history)
+        
+        messages.append({
+            "role": "user",
+            "content": user_message
+        })
+        
+        return messages, memory_context
+    
+    def _stream_ollama(self, system_prompt: str, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream an Ollama chat completion, yielding content fragments"""
+        with self._http.post(
+            f"{self.ollama_host}/api/chat",
+            json={
+                "model": self.model,
+                "messages": [{"role": "system", "content": system_prompt}, *messages],
+                "stream": True,
+                "keep_alive": OLLAMA_KEEP_ALIVE
+            },
+            timeout=60,
+            stream=True
+        ) as response:
+            if not response.ok:
+                raise RuntimeError(f"Ollama returned {response.status_code}: {response.text[:200]}")
+            
+            # One JSON object per line; the last one has "done": true
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                content = chunk.get("message", {}).get("content")
+                if content:
+                    yield content
+                if chunk.get("done"):
+                    break
+    
     def _call_ollama(self, system_prompt: str, messages: List[Dict[str, str]]) -> str:
         """Call Ollama for LLM inference"""
-        prompt = ""
-        for msg in messages:
-            if msg["role"] == "user":
-                prompt += f"User: {msg['content']}\n"
-            else:
-                prompt += f"Assistant: {msg['content']}\n"
-        
-        if messages and messages[-1]["role"] == "user":
-            pass
-        
-        response = requests.post(
-            f"{self.ollama_host}/api/generate",
+        response = self._http.post(
+            f"{self.ollama_host}/api/chat",
             json={
                 "model": self.model,
-                "prompt": messages[-1]["content"] if messages else "",
-                "system": system_prompt,
-                "stream": False
+                "messages": [{"role": "system", "content": system_prompt}, *messages],
+                "stream": False,
+                "keep_alive": OLLAMA_KEEP_ALIVE
             },
             timeout=60
         )
@@ -144,7 +228,7 @@ class ConversationEngine:
             raise Exception(f"Ollama returned {response.status_code}: {response.text[:200]}")
         
         data = response.json()
-        return data.get("response", "")
+        return data.get("message", {}).get("content", "")
     
     def list_constructs(self) -> List[Dict[str, Any]]:
         """List all available constructs"""
@@ -184,10 +268,14 @@ class ConversationEngine:
 
 
 _default_engine: Optional[ConversationEngine] = None
+_default_lock = threading.Lock()
 
 def get_conversation_engine(vvault_root: Optional[str] = None) -> ConversationEngine:
     """Get the default conversation engine singleton"""
     global _default_engine
     if _default_engine is None:
-        _default_engine = ConversationEngine(vvault_root)
+        # Double-checked so concurrent first calls build only one instance
+        with _default_lock:
+            if _default_engine is None:
+                _default_engine = ConversationEngine(vvault_root)
     return _default_engine
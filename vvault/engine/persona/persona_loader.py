@@ -6,13 +6,39 @@ Loads construct identity/persona files and builds system prompts
 import os
 import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Most personas kept in memory at once; least recently used are dropped first
+PERSONA_CACHE_SIZE = 256
+
+def _read_json(path: Path) -> Any:
+    """Read and decode a JSON file, preferring orjson"""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _mtimes(paths: Tuple[Path, ...]) -> Tuple[Optional[int], ...]:
+    """Return each path's mtime in nanoseconds, or None where it does not exist"""
+    result = []
+    for path in paths:
+        try:
+            result.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            result.append(None)
+    return tuple(result)
+
+@dataclass(slots=True)
 class PersonaContext:
     construct_id: str
     display_name: str
@@ -21,6 +47,7 @@ class PersonaContext:
     traits: Dict[str, float] = field(default_factory=dict)
     personality: Dict[str, Any] = field(default_factory=dict)
     role: str = "assistant"
+    full_prompt: Optional[str] = None  # assembled by build_full_prompt on first use
 
 
 class PersonaLoader:
@@ -29,25 +56,56 @@ class PersonaLoader:
     def __init__(self, vvault_root: Optional[str] = None):
         self.vvault_root = Path(vvault_root) if vvault_root else Path(__file__).parent.parent.parent
         self.instances_dir = self.vvault_root / "instances"
-        self._cache: Dict[str, PersonaContext] = {}
+        # construct_id -> (context, source files, their mtimes when loaded)
+        self._cache: "OrderedDict[str, Tuple[PersonaContext, Tuple[Path, ...], Tuple[Optional[int], ...]]]" = OrderedDict()
+        # construct_id -> resolved construct directory
+        self._paths: Dict[str, Path] = {}
+        # Guards _cache and _paths; file I/O happens outside it
+        self._lock = threading.Lock()
     
     def _find_construct_path(self, construct_id: str) -> Optional[Path]:
-        """Find the path to a construct by searching shards"""
-        if not self.instances_dir.exists():
+        """Find the path to a construct by searching shards
+        
+        Resolved paths are remembered, so later lookups cost one stat instead
+        of a scan of every shard. Misses are not remembered, so a construct
+        added after startup is still found.
+        """
+        with self._lock:
+            cached = self._paths.get(construct_id)
+        if cached is not None:
+            if cached.is_dir():
+                return cached
+            with self._lock:
+                self._paths.pop(construct_id, None)
+        
+        try:
+            with os.scandir(self.instances_dir) as it:
+                shard_paths = [e.path for e in it if e.name.startswith("shard_") and e.is_dir()]
+        except FileNotFoundError:
             return None
         
-        for shard in self.instances_dir.iterdir():
-            if shard.is_dir() and shard.name.startswith("shard_"):
-                construct_path = shard / construct_id
-                if construct_path.exists():
-                    return construct_path
+        for shard_path in shard_paths:
+            construct_path = Path(shard_path) / construct_id
+            if construct_path.exists():
+                with self._lock:
+                    self._paths[construct_id] = construct_path
+                return construct_path
         
         return None
     
     def load(self, construct_id: str, force: bool = False) -> Optional[PersonaContext]:
         """Load persona context for a construct"""
-        if not force and construct_id in self._cache:
-            return self._cache[construct_id]
+        with self._lock:
+            cached = self._cache.get(construct_id)
+        if cached and not force:
+            context, source_files, mtimes = cached
+            # Pick up edits to the persona files without needing force=True
+            if _mtimes(source_files) == mtimes:
+                with self._lock:
+                    # Another thread may have evicted it since the lookup
+                    if construct_id in self._cache:
+                        self._cache.move_to_end(construct_id)
+                return context
         
         construct_path = self._find_construct_path(construct_id)
         if not construct_path:
@@ -57,6 +115,16 @@ class PersonaLoader:
         identity_dir = construct_path / "identity"
         config_dir = construct_path / "config"
         
+        # Stat before reading so an edit made mid-load is seen on the next call
+        source_files = (
+            identity_dir / "prompt.json",
+            identity_dir / "conditioning.txt",
+            config_dir / "personality.json"
+        )
+        mtimes = _mtimes(source_files)
+        prompt_json, conditioning_file, personality_json = source_files
+        has_prompt, has_conditioning, has_personality = (m is not None for m in mtimes)
+        
         system_prompt = ""
         conditioning = ""
         traits = {}
@@ -64,11 +132,9 @@ class PersonaLoader:
         display_name = construct_id.split('-')[0].title()
         role = "assistant"
         
-        prompt_json = identity_dir / "prompt.json"
-        if prompt_json.exists():
+        if has_prompt:
             try:
-                with open(prompt_json, 'r') as f:
-                    data = json.load(f)
+                data = _read_json(prompt_json)
                 system_prompt = data.get('system_prompt', '') or data.get('prompt', '')
                 conditioning = data.get('conditioning', '')
                 traits = data.get('traits', {})
@@ -78,18 +144,15 @@ class PersonaLoader:
                 logger.error(f"Error loading prompt.json for {construct_id}: {e}")
         
         if not conditioning:
-            conditioning_file = identity_dir / "conditioning.txt"
-            if conditioning_file.exists():
+            if has_conditioning:
                 try:
                     conditioning = conditioning_file.read_text()
                 except Exception as e:
                     logger.error(f"Error loading conditioning.txt for {construct_id}: {e}")
         
-        personality_json = config_dir / "personality.json"
-        if personality_json.exists():
+        if has_personality:
             try:
-                with open(personality_json, 'r') as f:
-                    personality = json.load(f)
+                personality = _read_json(personality_json)
                 if not traits and 'traits' in personality:
                     traits = personality['traits']
             except Exception as e:
@@ -108,7 +171,11 @@ class PersonaLoader:
             role=role
         )
         
-        self._cache[construct_id] = context
+        with self._lock:
+            self._cache[construct_id] = (context, source_files, mtimes)
+            self._cache.move_to_end(construct_id)
+            if len(self._cache) > PERSONA_CACHE_SIZE:
+                self._cache.popitem(last=False)
         logger.debug(f"Loaded persona for {construct_id}")
         return context
     
@@ -131,12 +198,16 @@ class PersonaLoader:
         if not context:
             return ""
         
-        parts = [context.system_prompt]
-        
-        if context.conditioning:
-            parts.append(f"\n\n{context.conditioning}")
+        # The persona is immutable once loaded, so assemble its prompt once
+        if context.full_prompt is None:
+            parts = [context.system_prompt]
+            
+            if context.conditioning:
+                parts.append(f"\n\n{context.conditioning}")
+            
+            context.full_prompt = "\n".join(parts)
         
-        return "\n".join(parts)
+        return context.full_prompt
     
     def get_traits(self, construct_id: str) -> Dict[str, float]:
         """Get personality traits for a construct"""
@@ -145,17 +216,22 @@ class PersonaLoader:
     
     def clear_cache(self, construct_id: Optional[str] = None):
         """Clear persona cache"""
-        if construct_id:
-            self._cache.pop(construct_id, None)
-        else:
-            self._cache.clear()
+        with self._lock:
+            if construct_id:
+                self._cache.pop(construct_id, None)
+            else:
+                self._cache.clear()
 
 
 _default_loader: Optional[PersonaLoader] = None
+_default_lock = threading.Lock()
 
 def get_persona_loader(vvault_root: Optional[str] = None) -> PersonaLoader:
     """Get the default persona loader singleton"""
     global _default_loader
     if _default_loader is None:
-        _default_loader = PersonaLoader(vvault_root)
+        # Double-checked so concurrent first calls build only one instance
+        with _default_lock:
+            if _default_loader is None:
+                _default_loader = PersonaLoader(vvault_root)
     return _default_loader
@@ -20,12 +20,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-logger = logging.getLogger(__name__)
+from vvault.paths import PROJECT_DIR, LAYERS_DIR, DATA_DIR, CONFIG_DIR
 
-PROJECT_DIR = Path(__file__).parent.parent.parent
-LAYERS_DIR = PROJECT_DIR / "vvault" / "layers"
-DATA_DIR = PROJECT_DIR / "vvault" / "data"
-CONFIG_DIR = PROJECT_DIR / "vvault" / "config"
+logger = logging.getLogger(__name__)
 
 LAYER1_MANIFEST_SCHEMA = {
     "required_fields": [
@@ -40,6 +40,13 @@ except ImportError:
     SENTENCE_TRANSFORMER_AVAILABLE = False
     logging.warning("SentenceTransformer not available, using mock embeddings")
 
+# ijson for streaming large ChatGPT JSON exports
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -80,7 +87,8 @@ class FastMemoryImporter:
         batch_size: int = 1000,
         max_workers: int = 8,
         embed_model: str = "all-MiniLM-L6-v2",
-        embed_dim: int = 384
+        embed_dim: int = 384,
+        insert_batch_size: int = 200
     ):
         """
         Initialize fast memory importer
@@ -92,9 +100,11 @@ class FastMemoryImporter:
             max_workers: Number of parallel workers for processing
             embed_model: Embedding model name
             embed_dim: Embedding dimension
+            insert_batch_size: Maximum records per ChromaDB add() call
         """
         self.construct_id = construct_id
         self.batch_size = batch_size
+        self.insert_batch_size = insert_batch_size
         self.max_workers = max_workers
         self.embed_model = embed_model
         self.embed_dim = embed_dim
@@ -223,7 +233,11 @@ class FastMemoryImporter:
             f.seek(0)
             
             # Check if it's JSON format (ChatGPT export)
-            if first_lines.strip().startswith('[') or first_lines.strip().startswith('{'):
+            if first_lines.strip().startswith('[') and IJSON_AVAILABLE:
+                # Stream conversations so multi-GB exports never load whole
+                with open(file_path, 'rb') as fb:
+                    yield from self._parse_json_export_stream(fb)
+            elif first_lines.strip().startswith('[') or first_lines.strip().startswith('{'):
                 yield from self._parse_json_export(f)
             else:
                 # Text format (reverse chronological or standard)
@@ -241,61 +255,74 @@ class FastMemoryImporter:
                 conversations = [data]
             
             for convo in conversations:
-                mapping = convo.get('mapping', {})
-                nodes = []
-                
-                for node_id, node_data in mapping.items():
-                    message = node_data.get('message')
-                    if message:
-                        nodes.append({
-                            'id': node_id,
-                            'message': message,
-                            'create_time': message.get('create_time', 0)
-                        })
-                
-                # Sort by timestamp
-                nodes.sort(key=lambda x: x['create_time'])
-                
-                for node in nodes:
-                    msg = node['message']
-                    content = msg.get('content', {})
-                    
-                    # Extract text content
-                    if isinstance(content, str):
-                        text = content
-                    elif isinstance(content, dict):
-                        parts = content.get('parts', [])
-                        text = ' '.join(str(p) for p in parts if p)
-                    elif isinstance(content, list):
-                        text = ' '.join(str(p) for p in content if p)
-                    else:
-                        continue
-                    
-                    if not text.strip():
-                        continue
-                    
-                    # Extract role
-                    author = msg.get('author', {})
-                    role = author.get('role', 'unknown')
-                    if role == 'user':
-                        role = 'user'
-                    elif role == 'assistant':
-                        role = 'assistant'
-                    else:
-                        role = 'system'
-                    
-                    yield {
-                        'role': role,
-                        'content': text.strip(),
-                        'timestamp': msg.get('create_time', 0),
-                        'message_id': node['id'],
-                        'conversation_id': convo.get('id', 'unknown')
-                    }
+                yield from self._iter_conversation_messages(convo)
         
         except json.JSONDecodeError as e:
             logger.error(f"❌ Failed to parse JSON export: {e}")
             raise
     
+    def _parse_json_export_stream(self, file_handle) -> Iterator[Dict[str, Any]]:
+        """Parse a ChatGPT JSON export array one conversation at a time"""
+        try:
+            for convo in ijson.items(file_handle, 'item', use_float=True):
+                yield from self._iter_conversation_messages(convo)
+        except ijson.JSONError as e:
+            logger.error(f"❌ Failed to parse JSON export: {e}")
+            raise
+    
+    def _iter_conversation_messages(self, convo: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the messages of one exported conversation in timestamp order"""
+        mapping = convo.get('mapping', {})
+        nodes = []
+        
+        for node_id, node_data in mapping.items():
+            message = node_data.get('message')
+            if message:
+                nodes.append({
+                    'id': node_id,
+                    'message': message,
+                    'create_time': message.get('create_time', 0)
+                })
+        
+        # Sort by timestamp
+        nodes.sort(key=lambda x: x['create_time'])
+        
+        for node in nodes:
+            msg = node['message']
+            content = msg.get('content', {})
+            
+            # Extract text content
+            if isinstance(content, str):
+                text = content
+            elif isinstance(content, dict):
+                parts = content.get('parts', [])
+                text = ' '.join(str(p) for p in parts if p)
+            elif isinstance(content, list):
+                text = ' '.join(str(p) for p in content if p)
+            else:
+                continue
+            
+            if not text.strip():
+                continue
+            
+            # Extract role
+            author = msg.get('author', {})
+            role = author.get('role', 'unknown')
+            if role == 'user':
+                role = 'user'
+            elif role == 'assistant':
+                role = 'assistant'
+            else:
+                role = 'system'
+            
+            yield {
+                'role': role,
+                'content': text.strip(),
+                'timestamp': msg.get('create_time', 0),
+                'message_id': node['id'],
+                'conversation_id': convo.get('id', 'unknown')
+            }
+    
     def _parse_text_conversation(self, file_handle, file_path: str) -> Iterator[Dict[str, Any]]:
         """Parse text-based conversation (supports reverse chronological)"""
         lines = []
@@ -701,25 +728,29 @@ class FastMemoryImporter:
         else:
             embeddings = None
         
-        # Add to ChromaDB
+        # Add to ChromaDB in bounded slices so each add() stays within
+        # ChromaDB's efficient batch window
         try:
-            if embeddings:
-                # Add with pre-computed embeddings
-                self.collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids,
-                    embeddings=embeddings
-                )
-            else:
-                # Let ChromaDB generate embeddings
-                self.collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+            step = self.insert_batch_size
+            for start in range(0, len(documents), step):
+                end = start + step
+                if embeddings:
+                    # Add with pre-computed embeddings
+                    self.collection.add(
+                        documents=documents[start:end],
+                        metadatas=metadatas[start:end],
+                        ids=ids[start:end],
+                        embeddings=embeddings[start:end]
+                    )
+                else:
+                    # Let ChromaDB generate embeddings
+                    self.collection.add(
+                        documents=documents[start:end],
+                        metadatas=metadatas[start:end],
+                        ids=ids[start:end]
+                    )
             
-            # Force persist
+            # Force persist once per batch
             self.chroma_client.persist()
             
             return len(documents)
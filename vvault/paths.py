@@ -0,0 +1,21 @@
+"""
+VVAULT Filesystem Paths
+Canonical project locations, resolved once at import and shared by the
+boot and layer modules.
+"""
+
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+VVAULT_DIR = PROJECT_DIR / "vvault"
+LAYERS_DIR = VVAULT_DIR / "layers"
+DATA_DIR = VVAULT_DIR / "data"
+BOOT_DIR = VVAULT_DIR / "boot"
+CONFIG_DIR = VVAULT_DIR / "config"
+
+OATH_SEED_PATH = DATA_DIR / "oath_lock_seed.txt"
+REGISTRY_PATH = DATA_DIR / "construct_capsule_registry.json"
+
+# Append-only JSON Lines ledger; the single-document ledger is read-only history
+LEDGER_PATH = DATA_DIR / "vvault_continuity_ledger.jsonl"
+LEGACY_LEDGER_PATH = DATA_DIR / "vvault_continuity_ledger.json"